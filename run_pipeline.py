@@ -10,6 +10,7 @@ import sys
 from pathlib import Path
 import zipfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 import torch
 from PIL import Image
@@ -22,15 +23,33 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent))
 
 from verifier.utils.logger import get_logger
-from verifier.io.storage import ensure_directories, save_results
+from verifier.io.storage import (
+    ensure_directories, save_results,
+    document_fingerprint, document_cache_variant, lookup_cached_result, store_cached_result
+)
 from verifier.ocr.preproc import preprocess_image
-from verifier.extract.regex_extractors import extract_entities
+from verifier.extract.regex_extractors import extract_entities, select_groq_model
 from verifier.normalize.cleaners import apply_confusion_corrections
-from verifier.ocr.mistral_ocr import run_mistral_ocr
-from verifier.ocr.mistral_ocr_enhanced import run_enhanced_mistral_ocr
+from verifier.ocr.mistral_ocr import get_mistral_ocr
+from verifier.ocr.mistral_ocr_enhanced import get_enhanced_mistral_ocr, PROMPT_VERSION
 
 logger = get_logger(__name__)
 
+# OCR result keys -> engine names reported in `ocr_engines_used`
+OCR_ENGINE_LABELS = {
+    "mistral": "Mistral API",
+    "mistral_enhanced": "Mistral API Enhanced",
+}
+
+# OCR result keys -> `ocr` config flags that enable them
+OCR_ENGINE_FLAGS = {
+    "mistral": "enable_mistral_ocr",
+    "mistral_enhanced": "enable_mistral_ocr_enhanced",
+}
+
+# Bump to invalidate cached document results after extraction/merge changes
+DOC_CACHE_VERSION = "1"
+
 
 class DocumentVerificationPipeline:
     def __init__(self, config_path: str = "config.yml", use_llm: bool = False):
@@ -87,52 +106,44 @@ class DocumentVerificationPipeline:
 
         mistral_key = self.config.get("ocr", {}).get("mistral_api_key")
         groq_key = self.config.get("llm", {}).get("groq_api_key")
-        groq_model = self.config.get("llm", {}).get("groq_model", "openai/gpt-oss-20b")
+        groq_model = self.config.get("llm", {}).get("groq_model")  # None = per-doc-type model
+        use_doc_cache = self.config.get("cache", {}).get("document_results", True)
 
-        # Process each document type separately
+        # Resolve cached documents and preprocess the rest
+        documents = []
         for doc_type, doc_path in document_paths.items():
             if not os.path.exists(doc_path):
                 logger.error(f"❌ Document file not found: {doc_path}")
                 continue
 
-            # Preprocess image
-            logger.info(f"   ⚙️  Preprocessing {doc_type} image...")
-            preprocessed_img, preproc_time = preprocess_image(doc_path)
+            # Identical files skip OCR and extraction entirely
+            fingerprint = document_fingerprint(doc_path) if use_doc_cache else None
+            variant = self._doc_cache_variant(doc_type, mistral_key, groq_key, groq_model) if fingerprint else ""
+            cached = lookup_cached_result(fingerprint, doc_type, variant) if fingerprint else None
+            if cached is None:
+                # Preprocess image
+                logger.info(f"   ⚙️  Preprocessing {doc_type} image...")
+                preprocessed_img, preproc_time = preprocess_image(doc_path)
+            documents.append((doc_type, doc_path, fingerprint, variant, cached))
 
-            # Initialize OCR results for this document type
-            doc_ocr_results = {}
-
-            # --- Original Mistral OCR ---
-            if self.config.get("ocr", {}).get("enable_mistral_ocr", True) and mistral_key:
-                try:
-                    if "Mistral API" not in active_ocr_engines:
-                        active_ocr_engines.append("Mistral API")
-                    logger.info(f"   🤖 Using Original Mistral API OCR for {doc_type}...")
-                    mistral_result = run_mistral_ocr(doc_path, mistral_key, save_output=True)
-                    # Ensure dict format
-                    if isinstance(mistral_result, str):
-                        mistral_result = {"raw_text": mistral_result, "success": True}
-                    doc_ocr_results['mistral'] = mistral_result
-                    logger.info(f"   ✅ Original Mistral OCR for {doc_type}: {len(mistral_result.get('raw_text',''))} chars")
-                except Exception as e:
-                    logger.error(f"   💥 Original Mistral OCR error for {doc_type}: {e}")
+        # Run every OCR call for this person concurrently
+        pending = [(doc_type, doc_path, fingerprint) for doc_type, doc_path, fingerprint, _, cached in documents if cached is None]
+        pending_ocr = self._run_ocr_engines(pending, mistral_key, active_ocr_engines) if pending else {}
 
-            # --- Enhanced Mistral OCR ---
-            if self.config.get("ocr", {}).get("enable_mistral_ocr_enhanced", True) and mistral_key:
-                try:
-                    if "Mistral API Enhanced" not in active_ocr_engines:
-                        active_ocr_engines.append("Mistral API Enhanced")
-                    logger.info(f"   🤖 Using Mistral API Enhanced OCR for {doc_type}...")
-                    mistral_result_enh = run_enhanced_mistral_ocr(doc_path, mistral_key, doc_type=doc_type, save_output=True)
-                    # Ensure dict format
-                    if isinstance(mistral_result_enh, str):
-                        mistral_result_enh = {"raw_text": mistral_result_enh, "success": True}
-                    doc_ocr_results['mistral_enhanced'] = mistral_result_enh
-                    logger.info(f"   ✅ Mistral Enhanced OCR for {doc_type}: {len(mistral_result_enh.get('raw_text',''))} chars")
-                except Exception as e:
-                    logger.error(f"   💥 Mistral Enhanced OCR error for {doc_type}: {e}")
+        # Process each document type separately
+        for doc_type, doc_path, fingerprint, variant, cached in documents:
+            if cached is not None:
+                logger.info(f"   ♻️  Using cached result for {doc_type} ({fingerprint[:12]})")
+                ocr_results[doc_type] = cached.get("ocr_results", {})
+                for engine in ocr_results[doc_type]:
+                    label = OCR_ENGINE_LABELS.get(engine)
+                    if label and label not in active_ocr_engines:
+                        active_ocr_engines.append(label)
+                self._merge_extracted(all_extracted_data, cached.get("extracted_data", {}))
+                continue
 
             # Store OCR results for this document type
+            doc_ocr_results = pending_ocr[doc_type]
             ocr_results[doc_type] = doc_ocr_results
 
             # --- Extract entities for this document ---
@@ -140,11 +151,15 @@ class DocumentVerificationPipeline:
                 # Pass the OCR results for THIS document only
                 extracted_data = extract_entities(doc_ocr_results, doc_type, use_groq=True, groq_api_key=groq_key, groq_model=groq_model)
                 extracted_data = apply_confusion_corrections(extracted_data)
-                
-                # Merge extracted data (prioritize non-empty values)
-                for field, value in extracted_data.items():
-                    if value and value.get('value'):
-                        all_extracted_data[field] = value
+                self._merge_extracted(all_extracted_data, extracted_data)
+
+                # Only Groq extractions are worth replaying; regex fallbacks are retried next run
+                from_groq = any(isinstance(v, dict) and v.get('source') == 'groq' for v in extracted_data.values())
+                if fingerprint and from_groq:
+                    store_cached_result(fingerprint, doc_type, {
+                        "ocr_results": doc_ocr_results,
+                        "extracted_data": extracted_data
+                    }, variant)
             except Exception as e:
                 logger.error(f"   💥 Extraction error for {doc_type}: {e}")
 
@@ -175,6 +190,81 @@ class DocumentVerificationPipeline:
             "ocr_engines_used": active_ocr_engines
         }
 
+    def _doc_cache_variant(self, doc_type: str, mistral_key: str, groq_key: str, groq_model: str) -> str:
+        """Cache variant for a document: the OCR engines, prompts and Groq model that produce its result."""
+        ocr_config = self.config.get("ocr", {})
+        engines = sorted(
+            engine for engine, flag in OCR_ENGINE_FLAGS.items()
+            if mistral_key and ocr_config.get(flag, True)
+        )
+        return document_cache_variant({
+            "version": DOC_CACHE_VERSION,
+            "ocr_engines": engines,
+            "ocr_prompt_version": PROMPT_VERSION,
+            "groq_model": select_groq_model(doc_type, groq_model) if groq_key else None,
+        })
+
+    def _run_ocr_engines(self, documents: List[tuple], mistral_key: str,
+                         active_ocr_engines: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the enabled Mistral OCR engines over all documents at once, keyed by doc type.
+
+        `documents` holds (doc_type, doc_path, fingerprint) triples; a known
+        fingerprint is passed on so the OCR cache does not hash the file again.
+        The calls are network-bound, so a thread pool overlaps their round-trips
+        without needing an event loop (callers may already be running one).
+        """
+        ocr_config = self.config.get("ocr", {})
+        concurrency = ocr_config.get("max_concurrency", 8)
+        doc_ocr_results = {doc_type: {} for doc_type, _, _ in documents}
+        if not mistral_key:
+            return doc_ocr_results
+
+        engines = []
+        # --- Original Mistral OCR ---
+        if ocr_config.get(OCR_ENGINE_FLAGS["mistral"], True):
+            ocr_engine = get_mistral_ocr(mistral_key)
+            engines.append(("mistral", lambda doc_path, doc_type, fingerprint: ocr_engine.run_ocr(doc_path, save_output=True)))
+        # --- Enhanced Mistral OCR ---
+        if ocr_config.get(OCR_ENGINE_FLAGS["mistral_enhanced"], True):
+            enhanced_engine = get_enhanced_mistral_ocr(mistral_key, ocr_config.get("upload_images", False))
+            engines.append(("mistral_enhanced", lambda doc_path, doc_type, fingerprint: enhanced_engine.run_ocr(
+                doc_path, doc_type, save_output=True, fingerprint=fingerprint
+            )))
+
+        for engine, _ in engines:
+            label = OCR_ENGINE_LABELS[engine]
+            if label not in active_ocr_engines:
+                active_ocr_engines.append(label)
+            logger.info(f"   🤖 Using {label} OCR for {len(documents)} documents...")
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            calls = [
+                (doc_type, engine, executor.submit(run, doc_path, doc_type, fingerprint))
+                for engine, run in engines
+                for doc_type, doc_path, fingerprint in documents
+            ]
+            for doc_type, engine, future in calls:
+                label = OCR_ENGINE_LABELS[engine]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"   💥 {label} OCR error for {doc_type}: {e}")
+                    continue
+                # Ensure dict format
+                if isinstance(result, str):
+                    result = {"raw_text": result, "success": True}
+                doc_ocr_results[doc_type][engine] = result
+                logger.info(f"   ✅ {label} OCR for {doc_type}: {len(result.get('raw_text',''))} chars")
+        return doc_ocr_results
+
+    @staticmethod
+    def _merge_extracted(all_extracted_data: Dict[str, Any], extracted_data: Dict[str, Any]):
+        """Merge extracted data (prioritize non-empty values)."""
+        for field, value in extracted_data.items():
+            if value and value.get('value'):
+                all_extracted_data[field] = value
+
     def process_dataset(self, input_path: str) -> List[Dict[str, Any]]:
         results = []
 
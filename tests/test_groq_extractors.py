@@ -0,0 +1,83 @@
+"""
+Unit tests for the Groq extractor's streaming parser.
+"""
+
+import pytest
+from types import SimpleNamespace
+from verifier.extract.groq_extractors import GroqExtractor, IncrementalFieldParser
+
+def _feed_in_chunks(text, size):
+    """Feed `text` to a fresh parser `size` characters at a time, collecting completed pairs."""
+    parser = IncrementalFieldParser()
+    completed = []
+    for i in range(0, len(text), size):
+        completed.extend(parser.feed(text[i:i + size]))
+    return completed
+
+def test_incremental_parser_small_chunks():
+    """Test fields are reported once complete, whatever the chunk size."""
+    text = '{"full_name": {"value": "John Doe", "raw_context": "Name: John Doe"}, "pan_number": {"value": "ABCDE1234F", "raw_context": null}}'
+    expected = [
+        ("full_name", {"value": "John Doe", "raw_context": "Name: John Doe"}),
+        ("pan_number", {"value": "ABCDE1234F", "raw_context": None}),
+    ]
+    for size in (1, 2, 7, len(text)):
+        assert _feed_in_chunks(text, size) == expected
+
+def test_incremental_parser_escaped_quotes_and_braces():
+    """Test quotes, braces and commas inside strings do not end a value."""
+    text = '{"address": {"value": "Flat \\"B\\", {Block} 4, [Tower]", "raw_context": "a\\\\"}, "email_address": {"value": "x@y.com"}}'
+    assert _feed_in_chunks(text, 3) == [
+        ("address", {"value": 'Flat "B", {Block} 4, [Tower]', "raw_context": "a\\"}),
+        ("email_address", {"value": "x@y.com"}),
+    ]
+
+def test_incremental_parser_nested_values():
+    """Test nested objects and arrays are returned whole."""
+    text = '{"address": {"value": {"city": "Pune", "lines": ["1 MG Rd", {"pin": "411001"}]}}, "tags": [1, [2, 3]]}'
+    assert _feed_in_chunks(text, 4) == [
+        ("address", {"value": {"city": "Pune", "lines": ["1 MG Rd", {"pin": "411001"}]}}),
+        ("tags", [1, [2, 3]]),
+    ]
+
+def test_incremental_parser_leading_code_fence():
+    """Test a markdown code fence before the object is ignored."""
+    text = '```json\n{"pan_number": {"value": "ABCDE1234F"}}\n```'
+    assert _feed_in_chunks(text, 5) == [("pan_number", {"value": "ABCDE1234F"})]
+
+def test_incremental_parser_trailing_scalar():
+    """Test scalar values, including the last one before the closing brace."""
+    text = '{"count": 2, "valid": true, "score": 0.5}'
+    assert _feed_in_chunks(text, 1) == [("count", 2), ("valid", True), ("score", 0.5)]
+
+def test_extract_entities_streams_fields_to_callback():
+    """Test on_field receives each field as the stubbed stream completes it."""
+    response = '{"full_name": {"value": "John Doe", "raw_context": "Name"}, "pan_number": {"value": null, "raw_context": null}}'
+
+    def create(**kwargs):
+        assert kwargs.get("stream") is True
+        return [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=response[i:i + 6]))])
+            for i in range(0, len(response), 6)
+        ]
+
+    extractor = GroqExtractor(api_key="test-key", model="test-model")
+    extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    seen = []
+    result = extractor.extract_entities("Name: John Doe", "government_id", on_field=lambda name, data: seen.append((name, data)))
+
+    assert seen == [
+        ("full_name", {"value": "John Doe", "raw_context": "Name", "source": "groq", "confidence": "high"}),
+        ("pan_number", {"value": None, "raw_context": None}),
+    ]
+    assert result["full_name"]["value"] == "John Doe"
+    assert result["full_name"]["source"] == "groq"
+    assert result["pan_number"]["value"] is None
+
+def test_fields_fallback_recovers_overlapping_fields():
+    """Test each field is searched separately, so one match cannot hide the next field."""
+    extractor = GroqExtractor(api_key="test-key", model="test-model")
+    result = extractor._extract_fields_fallback('{"full_name": "x", "date_of_birth": {"value": "1990-01-01"}')
+    assert result["date_of_birth"]["value"] == "1990-01-01"
+    assert result["date_of_birth"]["source"] == "groq_fallback"
+    assert result["pan_number"]["value"] is None
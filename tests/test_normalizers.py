@@ -4,6 +4,7 @@ Unit tests for normalization functions.
 
 import pytest
 from verifier.normalize import normalizers
+from verifier.normalize.cleaners import correct_text
 
 def test_normalize_date():
     """Test date normalization."""
@@ -11,7 +12,9 @@ def test_normalize_date():
     assert normalizers.normalize_date("15-08-1947") == "1947-08-15"
     assert normalizers.normalize_date("15/08/1947") == "1947-08-15"
     assert normalizers.normalize_date("1947-08-15") == "1947-08-15"
-    assert normalizers.normalize_date("15-Aug-1947") is None  # Text months not supported
+    assert normalizers.normalize_date("2020-10-30") == "2020-10-30"  # not read as 20-10-30
+    assert normalizers.normalize_date("2020/6/25") == "2020-06-25"
+    assert normalizers.normalize_date("15-Aug-1947") == "1947-08-15"  # Month names supported
     
     # Test invalid dates
     assert normalizers.normalize_date("32-13-2020") is None
@@ -22,7 +25,7 @@ def test_normalize_phone():
     # Test Indian numbers
     assert normalizers.normalize_phone("9876543210") == "+919876543210"
     assert normalizers.normalize_phone("+91-9876543210") == "+919876543210"
-    assert normalizers.normalize_phone("09876543210") == "+9109876543210"
+    assert normalizers.normalize_phone("09876543210") == "+919876543210"  # Trunk 0 dropped
     
     # Test invalid numbers
     assert normalizers.normalize_phone("123") is None
@@ -31,7 +34,8 @@ def test_normalize_phone():
 def test_normalize_pan():
     """Test PAN number normalization."""
     assert normalizers.normalize_pan("ABCDE1234F") == "ABCDE1234F"
-    assert normalizers.normalize_pan("ab de 1234 f") == "ABDE1234F"  # Space removal
+    assert normalizers.normalize_pan("abcde 1234 f") == "ABCDE1234F"  # Space removal
+    assert normalizers.normalize_pan("ab de 1234 f") is None  # Only four letters
     assert normalizers.normalize_pan("ABCD12345F") is None  # Wrong format
     
 def test_normalize_aadhaar():
@@ -44,4 +48,39 @@ def test_normalize_name():
     """Test name normalization."""
     assert normalizers.normalize_name("john doe") == "John Doe"
     assert normalizers.normalize_name("JOHN DOE") == "John Doe"
-    assert normalizers.normalize_name("  john   doe  ") == "John Doe"
\ No newline at end of file
+    assert normalizers.normalize_name("  john   doe  ") == "John Doe"
+
+def test_correct_text():
+    """Test confusion-character correction."""
+    assert correct_text("98O S4l", "numeric") == "980541"
+    assert correct_text("J0HN 5MITH", "alpha") == "JOHN SMITH"
+    assert correct_text("ABOlI", "alphanumeric") == "AB011"
+    assert correct_text("", "numeric") == ""
+
+def test_normalizer_caches():
+    """Test memoized normalizers return the same results before and after a cache clear."""
+    normalizers.clear_normalizer_caches()
+    first = (
+        normalizers.normalize_phone("+91-9876543210"),
+        normalizers.normalize_pan("abcde 1234 f"),
+        normalizers.normalize_date("15/08/1947"),
+        normalizers.normalize_name("john doe"),
+    )
+    assert normalizers.normalize_phone.cache_info().currsize == 1
+    repeated = (
+        normalizers.normalize_phone("+91-9876543210"),
+        normalizers.normalize_pan("abcde 1234 f"),
+        normalizers.normalize_date("15/08/1947"),
+        normalizers.normalize_name("john doe"),
+    )
+    assert repeated == first
+    assert normalizers.normalize_phone.cache_info().hits == 1
+
+    # Cached addresses come back as fresh dicts, so callers may mutate them
+    address = normalizers.canonicalize_address("12 MG Road, Pune 411001")
+    address["city"] = "changed"
+    assert normalizers.canonicalize_address("12 MG Road, Pune 411001")["city"] != "changed"
+
+    normalizers.clear_normalizer_caches()
+    assert normalizers.normalize_phone.cache_info().currsize == 0
+    assert normalizers.normalize_phone("+91-9876543210") == first[0]
@@ -3,7 +3,10 @@ Unit tests for verification rules.
 """
 
 import pytest
-from verifier.verify.rules import verify_name_match, verify_dob_match, verify_pan_format
+from verifier.verify.rules import (
+    verify_name_match, verify_dob_match, verify_phone_match,
+    verify_pan_format, verify_aadhaar_format, verify_person
+)
 
 def test_name_match_rule():
     """Test name matching rule."""
@@ -19,6 +22,20 @@ def test_name_match_rule():
     result = verify_name_match(extracted_data)
     assert result["status"] == "PASS"
 
+def test_name_match_rule_uses_normalized_value():
+    """Test name matching on token order and precomputed match keys."""
+    extracted_data = {
+        "government_id": {
+            "full_name": {"value": "Doe John", "normalized_value": "doe john", "source": "groq"}
+        },
+        "bank_statement": {
+            "full_name": {"value": "JOHN DOE", "source": "regex"}
+        }
+    }
+    
+    result = verify_name_match(extracted_data)
+    assert result["status"] == "PASS"
+
 def test_dob_match_rule():
     """Test DOB matching rule."""
     extracted_data = {
@@ -33,6 +50,20 @@ def test_dob_match_rule():
     result = verify_dob_match(extracted_data)
     assert result["status"] == "PASS"
 
+def test_phone_match_rule():
+    """Test phone matching ignores formatting and the country code."""
+    extracted_data = {
+        "government_id": {
+            "phone_number": {"value": "+91 98765-43210", "confidence": "high", "source": "regex"}
+        },
+        "bank_statement": {
+            "phone_number": {"value": "9876543210", "confidence": "high", "source": "regex"}
+        }
+    }
+    
+    result = verify_phone_match(extracted_data)
+    assert result["status"] == "PASS"
+
 def test_pan_format_rule():
     """Test PAN format validation rule."""
     extracted_data = {
@@ -42,4 +73,32 @@ def test_pan_format_rule():
     }
     
     result = verify_pan_format(extracted_data)
-    assert result["status"] == "PASS"
\ No newline at end of file
+    assert result["status"] == "PASS"
+
+def test_aadhaar_format_rule():
+    """Test Aadhaar format validation rule."""
+    extracted_data = {
+        "government_id": {
+            "aadhaar_number": {"value": "123456789012", "confidence": "high", "source": "regex"}
+        }
+    }
+    
+    result = verify_aadhaar_format(extracted_data)
+    assert result["status"] == "PASS"
+    
+    extracted_data["government_id"]["aadhaar_number"]["value"] = "1234 5678 9012"
+    result = verify_aadhaar_format(extracted_data)
+    assert result["status"] == "FAIL"
+
+def test_verify_person_skips_rules_on_sparse_data():
+    """Test that too few extracted fields skips every rule."""
+    extracted_data = {
+        "government_id": {
+            "full_name": {"value": "John Doe", "confidence": "high", "source": "regex"},
+            "pan_number": {"value": "ABCDE1234F", "confidence": "high", "source": "regex"}
+        }
+    }
+    
+    results = verify_person(extracted_data)
+    assert len(results) == 7
+    assert all(result["status"] == "SKIPPED" for result in results.values())
\ No newline at end of file
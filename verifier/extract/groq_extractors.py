@@ -2,53 +2,269 @@
 Groq API for structured entity extraction using LLama2/Mixtral models.
 """
 
+import asyncio
 import json
 import re
 import time
-from typing import Dict, Any
-from groq import Groq
+import httpx
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+from groq import AsyncGroq, Groq
+from pydantic import BaseModel
+from verifier.io.storage import to_json_text
+from verifier.utils.async_http import LoopBoundClient
 from verifier.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is the fallback
+    orjson = None
+
 logger = get_logger(__name__)
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Entity fields requested from the model
+EXTRACTION_FIELDS = (
+    'full_name', 'father_name', 'date_of_birth', 'address',
+    'phone_number', 'email_address', 'aadhaar_number',
+    'pan_number', 'employee_id', 'account_number'
+)
+
+# Template for empty results; callers get per-field copies
+_EMPTY_EXTRACTION = {f: {"value": None, "raw_context": None} for f in EXTRACTION_FIELDS}
+
+# OCR characters sent to the model per document (~1k tokens); longer text is cut
+GROQ_MAX_OCR_CHARS = 3500
+
+# Response cleanup patterns, compiled once at import
+_CODE_FENCE_JSON_RE = re.compile(r'```json\s*')
+_CODE_FENCE_RE = re.compile(r'```\s*')
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Fields recoverable from malformed responses, one pattern each: a combined
+# alternation would let one field's match swallow the next field's key
+_FALLBACK_FIELD_RES = {
+    f: re.compile(rf'"{f}"[^}}]*"value"\s*:\s*"([^"]*)"')
+    for f in (
+        'full_name', 'date_of_birth', 'phone_number',
+        'email_address', 'aadhaar_number', 'pan_number'
+    )
+}
+
+# Below this many documents a batch job is not worth its queueing delay
+MIN_BATCH_SIZE = 50
+_BATCH_TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+# Completion budget per model: the JSON answer fits in ~1k tokens, but reasoning
+# models (gpt-oss) also spend tokens thinking before they answer
+DEFAULT_MAX_TOKENS = 2000
+MAX_TOKENS_BY_MODEL = {
+    "llama-3.1-8b-instant": 1024,
+    "llama-3.3-70b-versatile": 1024,
+}
+
+# Number of re-prompts when the model returns invalid JSON or breaks the schema
+MAX_PARSE_RETRIES = 2
+
+# Bump whenever the extraction prompt or schema changes; part of the extraction cache key
+EXTRACTION_PROMPT_VERSION = "1"
+
+
+class ExtractedField(BaseModel):
+    """A single extracted entity as returned by the model."""
+    value: Optional[Union[str, int, float, Dict[str, Any]]] = None
+    raw_context: Optional[Any] = None
+
+
+class GroqExtractionSchema(BaseModel):
+    """Expected shape of the Groq extraction response."""
+    full_name: Optional[ExtractedField] = None
+    father_name: Optional[ExtractedField] = None
+    date_of_birth: Optional[ExtractedField] = None
+    address: Optional[ExtractedField] = None
+    phone_number: Optional[ExtractedField] = None
+    email_address: Optional[ExtractedField] = None
+    aadhaar_number: Optional[ExtractedField] = None
+    pan_number: Optional[ExtractedField] = None
+    employee_id: Optional[ExtractedField] = None
+    account_number: Optional[ExtractedField] = None
+
+
+class IncrementalFieldParser:
+    """
+    Stateful parser for a JSON object arriving in chunks.
+
+    Each character is inspected once, and every top-level "key": value pair is
+    returned from `feed` as soon as its value is complete, so callers can act
+    on early fields while the rest of the response is still streaming.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._done = False
+        self._key_chars = None    # characters of the top-level key being read
+        self._key = None          # last complete top-level key
+        self._value_chars = None  # characters of the top-level value being read
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume a chunk and return (key, value) pairs completed by it."""
+        completed = []
+        for c in chunk:
+            if self._done:
+                break
+            if self._value_chars is not None:
+                self._value_chars.append(c)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._key_chars is not None:
+                        self._key = ''.join(self._key_chars)
+                        self._key_chars = None
+                elif self._key_chars is not None:
+                    self._key_chars.append(c)
+                continue
+
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1 and self._value_chars is None:
+                    self._key_chars = []
+            elif c == '{' or c == '[':
+                self._depth += 1
+            elif c == '}' or c == ']':
+                self._depth -= 1
+                if self._depth == 1 and self._value_chars is not None:
+                    # Nested object/array value just closed
+                    self._complete(self._value_chars, completed)
+                elif self._depth <= 0:
+                    if self._value_chars is not None:
+                        self._complete(self._value_chars[:-1], completed)
+                    self._done = True
+            elif self._depth == 1:
+                if c == ':' and self._value_chars is None:
+                    self._value_chars = []
+                elif c == ',' and self._value_chars is not None:
+                    # Scalar value terminated by the next pair
+                    self._complete(self._value_chars[:-1], completed)
+        return completed
+
+    def _complete(self, value_chars: List[str], completed: List[Tuple[str, Any]]):
+        """Decode a finished value and record it against the current key."""
+        self._value_chars = None
+        try:
+            completed.append((self._key, _json_loads(''.join(value_chars))))
+        except ValueError:
+            logger.debug(f"Skipping undecodable streamed value for {self._key}")
+
+
+_http_clients: Dict[int, httpx.Client] = {}
+
+
+def _pool_limits(pool_size: int) -> httpx.Limits:
+    """Connection limits for a pool of `pool_size` (half kept alive between calls)."""
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=max(1, pool_size // 2),
+        keepalive_expiry=60
+    )
+
+
+def _get_http_client(pool_size: int = 64) -> httpx.Client:
+    """Get or create the keep-alive HTTP client shared by Groq clients with this pool size."""
+    client = _http_clients.get(pool_size)
+    if client is None or client.is_closed:
+        client = _http_clients[pool_size] = httpx.Client(limits=_pool_limits(pool_size))
+    return client
+
+
 class GroqExtractor:
-    def __init__(self, api_key: str, model: str = "openai/gpt-oss-20b"):
-        """Initialize Groq API client."""
-        self.client = Groq(api_key=api_key)
+    def __init__(self, api_key: str, model: str = "openai/gpt-oss-20b", pool_size: int = 64):
+        """
+        Initialize Groq API client.
+
+        Args:
+            api_key: Groq API key
+            model: Groq model to use
+            pool_size: Max pooled HTTP connections (half are kept alive between calls)
+        """
+        # Keep-alive pool shared by all extractors of this pool size so per-model
+        # instances reuse the same TCP/TLS connections to api.groq.com
+        self._httpx = _get_http_client(pool_size)
+        self.client = Groq(api_key=api_key, http_client=self._httpx)
+        # Async connections are tied to an event loop, so that client is per loop
+        self._async_client = LoopBoundClient(
+            lambda http: AsyncGroq(api_key=api_key, http_client=http),
+            limits=_pool_limits(pool_size)
+        )
         self.model = model
-        logger.info(f"Groq extractor initialized with model: {model}")
+        logger.info(f"Groq extractor initialized with model: {model}, pool size: {pool_size}")
     
-    def extract_entities(self, ocr_text: Any, doc_type: str) -> Dict[str, Any]:
-        """Extract structured entities using Groq API."""
-        start_time = time.time()
+    def extract_entities(
+        self,
+        ocr_text: str,
+        doc_type: str,
+        on_field: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract structured entities using Groq API.
 
-        # 🔒 Ensure OCR text is a string
-        if not isinstance(ocr_text, str):
-            try:
-                ocr_text = json.dumps(ocr_text, ensure_ascii=False)
-                logger.debug(f"Converted non-string OCR text to JSON string for {doc_type}")
-            except Exception:
-                ocr_text = str(ocr_text)
+        Args:
+            ocr_text: OCR text (must already be a string)
+            doc_type: Type of document
+            on_field: Optional callback; when given, the response is streamed and
+                      on_field(field_name, field_data) is called as each field completes.
+                      A field may be reported again if the response is retried.
+
+        Returns:
+            Dict of extracted fields with metadata
+        """
+        start_time = time.time()
 
         try:
             messages = self._create_extraction_messages(ocr_text, doc_type)
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.1,
-                max_tokens=2000
-            )
-            response_text = response.choices[0].message.content
+            response_text = self._complete(messages, on_field)
+
+            # Re-prompt with the parse/schema error before giving up on the model output
+            for attempt in range(MAX_PARSE_RETRIES + 1):
+                extracted_data, error = self._parse_attempt(response_text, doc_type, attempt)
+                if error is None:
+                    break
+                time.sleep(1.0 * (attempt + 1))
+                messages = messages + self._create_feedback_messages(response_text, error)
+                response_text = self._complete(messages, on_field)
 
-            extracted_data = self._parse_groq_response(response_text)
             processing_time = (time.time() - start_time) * 1000
 
-            for field_name in extracted_data:
-                if extracted_data[field_name].get('value'):
-                    extracted_data[field_name].update({
-                        'source': 'groq',
-                        'confidence': 'high'
-                    })
+            logger.info(f"Groq extraction completed in {processing_time:.2f}ms for {doc_type}")
+            return extracted_data
+
+        except Exception as e:
+            logger.error(f"Groq extraction failed: {e}")
+            return self._get_empty_extraction()
+
+    async def extract_entities_async(self, ocr_text: str, doc_type: str) -> Dict[str, Any]:
+        """Async variant of `extract_entities` for concurrent extraction."""
+        start_time = time.time()
+
+        try:
+            messages = self._create_extraction_messages(ocr_text, doc_type)
+            response_text = await self._complete_async(messages)
+
+            for attempt in range(MAX_PARSE_RETRIES + 1):
+                extracted_data, error = self._parse_attempt(response_text, doc_type, attempt)
+                if error is None:
+                    break
+                await asyncio.sleep(1.0 * (attempt + 1))
+                messages = messages + self._create_feedback_messages(response_text, error)
+                response_text = await self._complete_async(messages)
+
+            processing_time = (time.time() - start_time) * 1000
 
             logger.info(f"Groq extraction completed in {processing_time:.2f}ms for {doc_type}")
             return extracted_data
@@ -56,6 +272,187 @@ class GroqExtractor:
         except Exception as e:
             logger.error(f"Groq extraction failed: {e}")
             return self._get_empty_extraction()
+
+    def extract_entities_batch(
+        self,
+        items: List[Tuple[str, str]],
+        poll_timeout_s: float = 3600.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract entities for many documents with a single Groq Batch API job.
+
+        Args:
+            items: List of (ocr_text, doc_type) pairs
+            poll_timeout_s: Give up waiting for the batch job after this many seconds
+
+        Returns:
+            Extractions in the same order as `items`. Documents without a usable
+            batch result are re-extracted individually.
+        """
+        if len(items) < MIN_BATCH_SIZE:
+            return [self.extract_entities(ocr_text, doc_type) for ocr_text, doc_type in items]
+
+        start_time = time.time()
+        try:
+            responses = self._run_batch(
+                [self._create_extraction_messages(ocr_text, doc_type) for ocr_text, doc_type in items],
+                poll_timeout_s
+            )
+        except Exception as e:
+            logger.error(f"Groq batch extraction failed: {e}, falling back to per-document calls")
+            responses = {}
+
+        results = []
+        for i, (ocr_text, doc_type) in enumerate(items):
+            extracted_data = None
+            response_text = responses.get(f"doc-{i}")
+            if response_text is not None:
+                try:
+                    extracted_data = self._mark_groq_fields(self._parse_groq_response(response_text))
+                except ValueError as e:
+                    logger.warning(f"Invalid Groq batch response for {doc_type}: {e}")
+            if extracted_data is None:
+                extracted_data = self.extract_entities(ocr_text, doc_type)
+            results.append(extracted_data)
+
+        processing_time = (time.time() - start_time) * 1000
+        logger.info(f"Groq batch extraction completed in {processing_time:.2f}ms for {len(items)} documents")
+        return results
+
+    def _run_batch(self, conversations: List[list], poll_timeout_s: float) -> Dict[str, str]:
+        """Submit conversations as one batch job and return response texts by custom_id."""
+        lines = [
+            json.dumps({
+                "custom_id": f"doc-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request_params(messages)
+            }, ensure_ascii=False)
+            for i, messages in enumerate(conversations)
+        ]
+        batch_file = self.client.files.create(
+            file=("extraction_batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=batch_file.id
+        )
+        logger.info(f"Submitted Groq batch {batch.id} with {len(conversations)} requests")
+
+        deadline = time.time() + poll_timeout_s
+        attempt = 0
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            if time.time() > deadline:
+                try:
+                    self.client.batches.cancel(batch.id)
+                except Exception:
+                    pass
+                raise TimeoutError(f"Groq batch {batch.id} still {batch.status} after {poll_timeout_s}s")
+            time.sleep(min(1.0 * (attempt + 1), 60.0))
+            attempt += 1
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f"Groq batch {batch.id} ended with status {batch.status}")
+
+        responses = {}
+        output = self.client.files.content(batch.output_file_id).read()
+        for line in output.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            body = (record.get('response') or {}).get('body') or {}
+            choices = body.get('choices') or []
+            if choices:
+                responses[record.get('custom_id')] = choices[0].get('message', {}).get('content') or ""
+        return responses
+
+    def _parse_attempt(
+        self,
+        response_text: str,
+        doc_type: str,
+        attempt: int
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[ValueError]]:
+        """
+        Parse one response of the re-prompt loop shared by the sync and async paths.
+
+        Returns:
+            (extracted_data, None) once done, or (None, error) when the model should
+            be re-prompted with `error`. After the last attempt, a decodable but
+            schema-invalid response keeps its well-formed fields; undecodable text
+            goes to the regex fallback.
+        """
+        parsed = None
+        try:
+            parsed = self._decode_groq_response(response_text)
+            return self._mark_groq_fields(self._validate_extraction_strict(parsed)), None
+        except ValueError as e:
+            if attempt < MAX_PARSE_RETRIES:
+                logger.warning(f"Invalid Groq response for {doc_type} (attempt {attempt + 1}): {e}")
+                return None, e
+            logger.error(f"Groq response invalid after {MAX_PARSE_RETRIES} retries: {e}")
+            if isinstance(parsed, dict):
+                return self._mark_groq_fields(self._validate_extraction(parsed)), None
+            return self._extract_fields_fallback(response_text), None
+
+    def _request_params(self, messages: list) -> Dict[str, Any]:
+        """Chat completion parameters shared by the direct, streaming and batch paths."""
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 0,
+            "max_tokens": MAX_TOKENS_BY_MODEL.get(self.model, DEFAULT_MAX_TOKENS)
+        }
+
+    def _mark_groq_fields(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Tag fields that have a value as high-confidence Groq output."""
+        for field_name in extracted_data:
+            if extracted_data[field_name].get('value'):
+                extracted_data[field_name].update({
+                    'source': 'groq',
+                    'confidence': 'high'
+                })
+        return extracted_data
+
+    async def _complete_async(self, messages: list) -> str:
+        """Run a chat completion on the async client and return the response text."""
+        # Rate-limit (429) responses are retried with backoff by the Groq SDK itself
+        response = await self._async_client.get().chat.completions.create(**self._request_params(messages))
+        return response.choices[0].message.content or ""
+
+    def _complete(
+        self,
+        messages: list,
+        on_field: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> str:
+        """Run a chat completion and return the response text."""
+        if on_field is None:
+            response = self.client.chat.completions.create(**self._request_params(messages))
+            return response.choices[0].message.content or ""
+
+        stream = self.client.chat.completions.create(**self._request_params(messages), stream=True)
+        parser = IncrementalFieldParser()
+        parts = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            for field_name, field_data in parser.feed(delta):
+                if field_name in EXTRACTION_FIELDS and isinstance(field_data, dict):
+                    on_field(field_name, self._mark_groq_fields({field_name: field_data})[field_name])
+        return ''.join(parts)
+
+    def _create_feedback_messages(self, response_text: str, error: Exception) -> list:
+        """Create follow-up messages asking the model to fix an invalid response."""
+        return [
+            {"role": "assistant", "content": response_text},
+            {"role": "user", "content": f"Your output had error: {error}. Return ONLY the JSON object described above."}
+        ]
     
     def _create_extraction_messages(self, ocr_text: str, doc_type: str) -> list:
         """Create messages for entity extraction."""
@@ -68,7 +465,7 @@ class GroqExtractor:
         DOCUMENT TYPE: {doc_type}
 
         OCR TEXT:
-        {ocr_text[:3500]}
+        {ocr_text[:GROQ_MAX_OCR_CHARS]}
 
         EXTRACTION TASK:
         Extract the following entities and return ONLY valid JSON.
@@ -107,54 +504,53 @@ class GroqExtractor:
         ]
     
     def _parse_groq_response(self, response_text: str) -> Dict[str, Any]:
-        """Parse Groq response and extract JSON."""
-        try:
-            cleaned_text = response_text.strip()
-            cleaned_text = re.sub(r'```json\s*', '', cleaned_text)
-            cleaned_text = re.sub(r'```\s*', '', cleaned_text)
+        """
+        Parse Groq response and extract JSON.
 
-            json_match = re.search(r'\{.*\}', cleaned_text, re.DOTALL)
-            if json_match:
-                cleaned_text = json_match.group()
+        Raises:
+            ValueError: If the response is not valid JSON or does not match the schema
+        """
+        return self._validate_extraction_strict(self._decode_groq_response(response_text))
 
-            extracted_data = json.loads(cleaned_text)
-            return self._validate_extraction(extracted_data)
+    def _decode_groq_response(self, response_text: str) -> Any:
+        """
+        Strip code fences and decode the JSON object in a Groq response.
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Groq response as JSON: {e}")
-            return self._extract_fields_fallback(response_text)
-        except Exception as e:
-            logger.error(f"Error processing Groq response: {e}")
-            return self._get_empty_extraction()
+        Raises:
+            ValueError: If the response is not valid JSON
+        """
+        cleaned_text = response_text.strip()
+        cleaned_text = _CODE_FENCE_JSON_RE.sub('', cleaned_text)
+        cleaned_text = _CODE_FENCE_RE.sub('', cleaned_text)
+
+        json_match = _JSON_OBJECT_RE.search(cleaned_text)
+        if json_match:
+            cleaned_text = json_match.group()
+
+        return _json_loads(cleaned_text)
     
     def _extract_fields_fallback(self, response_text: str) -> Dict[str, Any]:
         """Fallback extraction if JSON parsing fails."""
         extracted = self._get_empty_extraction()
-        patterns = {
-            'full_name': r'"full_name"[^}]*"value"\s*:\s*"([^"]*)"',
-            'date_of_birth': r'"date_of_birth"[^}]*"value"\s*:\s*"([^"]*)"',
-            'phone_number': r'"phone_number"[^}]*"value"\s*:\s*"([^"]*)"',
-            'email_address': r'"email_address"[^}]*"value"\s*:\s*"([^"]*)"',
-            'aadhaar_number': r'"aadhaar_number"[^}]*"value"\s*:\s*"([^"]*)"',
-            'pan_number': r'"pan_number"[^}]*"value"\s*:\s*"([^"]*)"',
-        }
-        for field, pattern in patterns.items():
-            match = re.search(pattern, response_text)
+        for field, pattern in _FALLBACK_FIELD_RES.items():
+            match = pattern.search(response_text)
             if match:
                 extracted[field]['value'] = match.group(1)
                 extracted[field]['source'] = 'groq_fallback'
                 extracted[field]['confidence'] = 'medium'
         return extracted
     
+    def _validate_extraction_strict(self, extracted_data: Any) -> Dict[str, Any]:
+        """Validate extracted data against the extraction schema, then normalize it."""
+        if not isinstance(extracted_data, dict):
+            raise ValueError(f"expected a JSON object, got {type(extracted_data).__name__}")
+        GroqExtractionSchema(**extracted_data)
+        return self._validate_extraction(extracted_data)
+
     def _validate_extraction(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and normalize extracted data."""
-        expected_fields = [
-            'full_name', 'father_name', 'date_of_birth', 'address',
-            'phone_number', 'email_address', 'aadhaar_number',
-            'pan_number', 'employee_id', 'account_number'
-        ]
         validated = {}
-        for f in expected_fields:
+        for f in EXTRACTION_FIELDS:
             if f in extracted_data and isinstance(extracted_data[f], dict):
                 validated[f] = extracted_data[f]
             else:
@@ -162,35 +558,67 @@ class GroqExtractor:
         return validated
     
     def _get_empty_extraction(self) -> Dict[str, Any]:
-        """Return empty extraction structure."""
-        fields = [
-            'full_name', 'father_name', 'date_of_birth', 'address',
-            'phone_number', 'email_address', 'aadhaar_number',
-            'pan_number', 'employee_id', 'account_number'
-        ]
-        return {f: {"value": None, "raw_context": None} for f in fields}
+        """Return empty extraction structure (fresh field dicts, safe to mutate)."""
+        return {f: dict(v) for f, v in _EMPTY_EXTRACTION.items()}
 
 
 # --- Global helper methods ---
 
-_groq_extractor = None
+_groq_extractors: Dict[Tuple[str, int], GroqExtractor] = {}
 
-def get_groq_extractor(api_key: str, model: str = "openai/gpt-oss-20b") -> GroqExtractor:
-    """Get or create Groq extractor instance."""
-    global _groq_extractor
-    if _groq_extractor is None:
-        _groq_extractor = GroqExtractor(api_key, model)
-    return _groq_extractor
+def get_groq_extractor(api_key: str, model: str = "openai/gpt-oss-20b", pool_size: int = 64) -> GroqExtractor:
+    """Get or create the Groq extractor instance for `model` and `pool_size`."""
+    extractor = _groq_extractors.get((model, pool_size))
+    if extractor is None:
+        extractor = _groq_extractors[(model, pool_size)] = GroqExtractor(api_key, model, pool_size)
+    return extractor
 
 
-def extract_with_groq(ocr_text: Any, doc_type: str, api_key: str, model: str = "openai/gpt-oss-20b") -> Dict[str, Any]:
-    """Extract entities using Groq API."""
-    # 🔒 Ensure string before passing to GroqExtractor
-    if not isinstance(ocr_text, str):
-        try:
-            ocr_text = json.dumps(ocr_text, ensure_ascii=False)
-        except Exception:
-            ocr_text = str(ocr_text)
+async def close_async_clients():
+    """Close the async HTTP clients the extractors opened on the running event loop."""
+    for extractor in _groq_extractors.values():
+        await extractor._async_client.aclose()
+
+
+def extract_with_groq(
+    ocr_text: Any,
+    doc_type: str,
+    api_key: str,
+    model: str = "openai/gpt-oss-20b",
+    on_field: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """Extract entities using Groq API, optionally streaming fields to `on_field`."""
+    # 🔒 Ensure string before passing to GroqExtractor (done once, here only)
+    if type(ocr_text) is not str:
+        ocr_text = to_json_text(ocr_text)
+
+    extractor = get_groq_extractor(api_key, model)
+    return extractor.extract_entities(ocr_text, doc_type, on_field)
+
+
+async def extract_with_groq_async(
+    ocr_text: Any,
+    doc_type: str,
+    api_key: str,
+    model: str = "openai/gpt-oss-20b"
+) -> Dict[str, Any]:
+    """Extract entities using the async Groq client."""
+    if type(ocr_text) is not str:
+        ocr_text = to_json_text(ocr_text)
+
+    extractor = get_groq_extractor(api_key, model)
+    return await extractor.extract_entities_async(ocr_text, doc_type)
+
 
+def extract_with_groq_batch(
+    items: List[Tuple[Any, str]],
+    api_key: str,
+    model: str = "openai/gpt-oss-20b"
+) -> List[Dict[str, Any]]:
+    """Extract entities for many (ocr_text, doc_type) pairs using the Groq Batch API."""
+    items = [
+        (ocr_text if type(ocr_text) is str else to_json_text(ocr_text), doc_type)
+        for ocr_text, doc_type in items
+    ]
     extractor = get_groq_extractor(api_key, model)
-    return extractor.extract_entities(ocr_text, doc_type)
\ No newline at end of file
+    return extractor.extract_entities_batch(items)
\ No newline at end of file
@@ -3,20 +3,54 @@
 Main entity extraction orchestrator - uses Mistral OCR + Groq API.
 """
 
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from verifier.utils.logger import get_logger
-from verifier.extract.groq_extractors import extract_with_groq
-import json
+from verifier.normalize.cleaners import compact_whitespace
+from verifier.io.storage import (
+    EXTRACTION_CACHE_DIR, extraction_cache_key, lookup_cached_extraction, store_cached_extraction,
+    to_json_text
+)
+from verifier.extract.groq_extractors import (
+    EXTRACTION_FIELDS, EXTRACTION_PROMPT_VERSION, GROQ_MAX_OCR_CHARS,
+    extract_with_groq, extract_with_groq_async, extract_with_groq_batch,
+    close_async_clients as close_async_groq_clients
+)
 
 logger = get_logger(__name__)
 
+DEFAULT_EXTRACTION_CACHE_DIR = EXTRACTION_CACHE_DIR
+
+# OCR engines to take extraction text from, most preferred first
+ENGINE_PRIORITY = ('mistral', 'mistral_enhanced')
+
+# Groq model tier per document type: short single-page docs go to the fast 8B
+# model, long tabular bank statements keep a 70B model
+DEFAULT_GROQ_MODEL = "openai/gpt-oss-20b"
+GROQ_MODEL_BY_DOC_TYPE = {
+    "government_id": "llama-3.1-8b-instant",
+    "employment_letter": "llama-3.1-8b-instant",
+    "bank_statement": "llama-3.3-70b-versatile",
+}
+
+_EMPTY_EXTRACTION = {
+    f: {"value": None, "raw_context": None, "confidence": "low", "source": "none"}
+    for f in EXTRACTION_FIELDS
+}
+
+
+def select_groq_model(doc_type: str, groq_model: Optional[str] = None) -> str:
+    """Return `groq_model` if given, else the model tier configured for `doc_type`."""
+    return groq_model or GROQ_MODEL_BY_DOC_TYPE.get(doc_type, DEFAULT_GROQ_MODEL)
+
 
 def extract_entities(
     ocr_results: Dict[str, Any],
     doc_type: str,
     use_groq: bool = True,
     groq_api_key: str = None,
-    groq_model: str = "openai/gpt-oss-20b"
+    groq_model: Optional[str] = None,
+    cache_dir: Optional[str] = DEFAULT_EXTRACTION_CACHE_DIR
 ) -> Dict[str, Any]:
     """
     Extract structured entities from OCR results using Groq API or fallback regex.
@@ -26,50 +60,244 @@ def extract_entities(
         doc_type: Type of document
         use_groq: Whether to use Groq for extraction
         groq_api_key: Groq API key
-        groq_model: Groq model to use
+        groq_model: Groq model to use (None picks one per doc type, see GROQ_MODEL_BY_DOC_TYPE)
+        cache_dir: Directory for cached Groq extractions (None disables the cache)
 
     Returns:
         Dict of extracted fields with metadata
     """
-    ocr_text = ""
+    ocr_text, result, groq_call = _prepare_extraction(
+        ocr_results, doc_type, use_groq, groq_api_key, groq_model, cache_dir
+    )
+    if result is not None:
+        return result
 
-    # Prefer Mistral OCR first
-    if 'mistral' in ocr_results and isinstance(ocr_results['mistral'], dict) and ocr_results['mistral'].get('success'):
-        ocr_text = _extract_raw_text(ocr_results['mistral'])
+    # --- Use Groq if enabled and API key available ---
+    if groq_call is not None:
+        groq_text, groq_model, cache_key = groq_call
+        try:
+            logger.info(f"Using Groq ({groq_model}) for entity extraction on {doc_type}")
+            extracted = extract_with_groq(groq_text, doc_type, groq_api_key, groq_model)
+            if _accept_groq_extraction(extracted, doc_type, cache_dir, cache_key):
+                return extracted
+        except Exception as e:
+            logger.error(f"Groq extraction failed: {e}, falling back to regex")
 
-    # Then Enhanced Mistral OCR
-    elif 'mistral_enhanced' in ocr_results and isinstance(ocr_results['mistral_enhanced'], dict) and ocr_results['mistral_enhanced'].get('success'):
-        ocr_text = _extract_raw_text(ocr_results['mistral_enhanced'])
+    # --- Fallback to regex extraction ---
+    return _extract_with_regex_fallback(ocr_text, doc_type)
 
-    # Fallback: first successful OCR engine
-    if not ocr_text:
-        for engine, result in ocr_results.items():
-            if isinstance(result, dict) and result.get('success') and result.get('raw_text'):
-                ocr_text = _extract_raw_text(result)
-                logger.info(f"Using {engine} OCR text for {doc_type}: {len(ocr_text)} chars")
-                break
 
-    if not ocr_text:
-        logger.warning(f"No OCR text available for {doc_type}")
-        return _get_empty_extraction()
+async def extract_entities_async(
+    ocr_results: Dict[str, Any],
+    doc_type: str,
+    use_groq: bool = True,
+    groq_api_key: str = None,
+    groq_model: Optional[str] = None,
+    cache_dir: Optional[str] = DEFAULT_EXTRACTION_CACHE_DIR
+) -> Dict[str, Any]:
+    """Async variant of `extract_entities`; the Groq call does not block the event loop."""
+    ocr_text, result, groq_call = _prepare_extraction(
+        ocr_results, doc_type, use_groq, groq_api_key, groq_model, cache_dir
+    )
+    if result is not None:
+        return result
 
-    # --- Use Groq if enabled and API key available ---
-    if use_groq and groq_api_key:
+    if groq_call is not None:
+        groq_text, groq_model, cache_key = groq_call
         try:
             logger.info(f"Using Groq ({groq_model}) for entity extraction on {doc_type}")
-            extracted = extract_with_groq(str(ocr_text), doc_type, groq_api_key, groq_model)
-
-            extracted_count = sum(1 for field in extracted.values() if field.get('value'))
-            if extracted_count > 0:
-                logger.info(f"Groq extracted {extracted_count} fields for {doc_type}")
+            extracted = await extract_with_groq_async(groq_text, doc_type, groq_api_key, groq_model)
+            if _accept_groq_extraction(extracted, doc_type, cache_dir, cache_key):
                 return extracted
-            else:
-                logger.warning(f"Groq extraction returned no values for {doc_type}, falling back to regex")
         except Exception as e:
             logger.error(f"Groq extraction failed: {e}, falling back to regex")
 
+    return _extract_with_regex_fallback(ocr_text, doc_type)
+
+
+async def extract_entities_many(
+    documents: List[Tuple[Dict[str, Any], str]],
+    use_groq: bool = True,
+    groq_api_key: str = None,
+    groq_model: Optional[str] = None,
+    cache_dir: Optional[str] = DEFAULT_EXTRACTION_CACHE_DIR,
+    concurrency: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Extract entities for many documents concurrently.
+
+    Args:
+        documents: List of (ocr_results, doc_type) pairs, one per document
+        concurrency: Max Groq requests in flight at once
+        (other args as in `extract_entities`)
+
+    Returns:
+        List of extracted-field dicts in the same order as `documents`
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract_one(ocr_results: Dict[str, Any], doc_type: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await extract_entities_async(
+                ocr_results, doc_type, use_groq, groq_api_key, groq_model, cache_dir
+            )
+
+    try:
+        return await asyncio.gather(*(_extract_one(ocr_results, doc_type) for ocr_results, doc_type in documents))
+    finally:
+        # The async Groq clients are bound to this loop; close them before it ends
+        await close_async_groq_clients()
+
+
+def extract_entities_batch(
+    documents: List[Tuple[Dict[str, Any], str]],
+    use_groq: bool = True,
+    groq_api_key: str = None,
+    groq_model: Optional[str] = None,
+    cache_dir: Optional[str] = DEFAULT_EXTRACTION_CACHE_DIR
+) -> List[Dict[str, Any]]:
+    """
+    Extract structured entities for many documents, submitting Groq calls as one batch job.
+
+    Intended for offline runs: batch jobs are cheaper per token but complete
+    asynchronously, so small batches go through the regular per-document path.
+
+    Args:
+        documents: List of (ocr_results, doc_type) pairs, one per document
+        use_groq: Whether to use Groq for extraction
+        groq_api_key: Groq API key
+        groq_model: Groq model to use (None picks one per doc type, see GROQ_MODEL_BY_DOC_TYPE)
+        cache_dir: Directory for cached Groq extractions (None disables the cache)
+
+    Returns:
+        List of extracted-field dicts in the same order as `documents`
+    """
+    texts: List[str] = []
+    results: List[Optional[Dict[str, Any]]] = []
+    groq_texts: Dict[int, str] = {}
+
+    pending: Dict[str, List[Tuple[int, Optional[str]]]] = {}  # model -> (index, cache_key) needing a Groq call
+    for i, (ocr_results, doc_type) in enumerate(documents):
+        ocr_text, result, groq_call = _prepare_extraction(
+            ocr_results, doc_type, use_groq, groq_api_key, groq_model, cache_dir
+        )
+        texts.append(ocr_text)
+        results.append(result)
+        if groq_call is not None:
+            groq_texts[i], model, cache_key = groq_call
+            pending.setdefault(model, []).append((i, cache_key))
+
+    # One batch job per model tier
+    for model, model_pending in pending.items():
+        try:
+            logger.info(f"Using Groq ({model}) batch extraction for {len(model_pending)} documents")
+            batch = extract_with_groq_batch(
+                [(groq_texts[i], documents[i][1]) for i, _ in model_pending], groq_api_key, model
+            )
+            for (i, cache_key), extracted in zip(model_pending, batch):
+                if _accept_groq_extraction(extracted, documents[i][1], cache_dir, cache_key):
+                    results[i] = extracted
+        except Exception as e:
+            logger.error(f"Groq batch extraction failed: {e}, falling back to regex")
+
     # --- Fallback to regex extraction ---
-    return _extract_with_regex_fallback(str(ocr_text), doc_type)
+    for i, (_, doc_type) in enumerate(documents):
+        if results[i] is None:
+            results[i] = _extract_with_regex_fallback(texts[i], doc_type)
+    return results
+
+
+def _prepare_extraction(
+    ocr_results: Dict[str, Any],
+    doc_type: str,
+    use_groq: bool,
+    groq_api_key: Optional[str],
+    groq_model: Optional[str],
+    cache_dir: Optional[str]
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[Tuple[str, str, Optional[str]]]]:
+    """
+    Shared first step of the sync, async and batch extraction paths.
+
+    Returns:
+        (ocr_text, result, groq_call): `result` is the final extraction when no
+        Groq call is needed (no OCR text, or a cache hit). Otherwise `groq_call`
+        is (groq_text, groq_model, cache_key) for the Groq request, or None when
+        Groq is disabled and the regex fallback applies.
+    """
+    ocr_text = _select_ocr_text(ocr_results, doc_type)
+
+    if not ocr_text:
+        logger.warning(f"No OCR text available for {doc_type}")
+        return ocr_text, _get_empty_extraction(), None
+
+    if not (use_groq and groq_api_key):
+        return ocr_text, None, None
+
+    groq_model = select_groq_model(doc_type, groq_model)
+    groq_text = _prepare_groq_text(ocr_text, doc_type)
+    cache_key = (
+        extraction_cache_key(groq_model, doc_type, groq_text, EXTRACTION_PROMPT_VERSION) if cache_dir else None
+    )
+    if cache_key is not None:
+        cached = _load_cached_extraction(cache_dir, cache_key)
+        if cached is not None:
+            logger.info(f"Using cached Groq extraction for {doc_type}: {cache_key[:12]}")
+            return ocr_text, cached, None
+    return ocr_text, None, (groq_text, groq_model, cache_key)
+
+
+def _select_ocr_text(ocr_results: Dict[str, Any], doc_type: str) -> str:
+    """
+    Pick the OCR text to extract from: the first successful engine with text,
+    trying ENGINE_PRIORITY first and then any other engine in `ocr_results`.
+    """
+    engines = list(ENGINE_PRIORITY) + [engine for engine in ocr_results if engine not in ENGINE_PRIORITY]
+    ocr_text = ""
+
+    for engine in engines:
+        result = ocr_results.get(engine)
+        if isinstance(result, dict) and result.get('success'):
+            ocr_text = _extract_raw_text(result)
+            if ocr_text:
+                if engine not in ENGINE_PRIORITY:
+                    logger.warning(f"No preferred OCR engine succeeded for {doc_type}, falling back to {engine}")
+                logger.info(f"Using {engine} OCR text for {doc_type}: {len(ocr_text)} chars")
+                break
+
+    # Callers rely on a string; checked explicitly so it also holds under -O
+    if not isinstance(ocr_text, str):
+        raise TypeError(f"OCR text for {doc_type} must be str, got {type(ocr_text).__name__}")
+    return ocr_text
+
+
+def _prepare_groq_text(ocr_text: str, doc_type: str) -> str:
+    """Compact whitespace and cut OCR text to what the Groq prompt will use."""
+    compact = compact_whitespace(ocr_text)[:GROQ_MAX_OCR_CHARS]
+    logger.info(f"Groq input for {doc_type}: {len(ocr_text)} -> {len(compact)} chars")
+    return compact
+
+
+def _accept_groq_extraction(
+    extracted: Dict[str, Any],
+    doc_type: str,
+    cache_dir: Optional[str],
+    cache_key: Optional[str]
+) -> bool:
+    """
+    Return True if a Groq extraction has values.
+
+    Only model output is cached: fields regex-scraped from a broken response
+    (source 'groq_fallback') are used for this run but retried next time.
+    """
+    extracted_count = sum(1 for field in extracted.values() if field.get('value'))
+    if extracted_count == 0:
+        logger.warning(f"Groq extraction returned no values for {doc_type}, falling back to regex")
+        return False
+
+    logger.info(f"Groq extracted {extracted_count} fields for {doc_type}")
+    if cache_key is not None and any(field.get('source') == 'groq' for field in extracted.values()):
+        store_cached_extraction(cache_key, extracted, cache_dir)
+    return True
 
 
 def _extract_raw_text(ocr_result: Dict[str, Any]) -> str:
@@ -86,20 +314,22 @@ def _extract_raw_text(ocr_result: Dict[str, Any]) -> str:
         logger.info(f"Using OCR text: {len(raw)} chars")
         return raw
     else:
-        try:
-            import json
-            return json.dumps(raw, ensure_ascii=False)
-        except Exception:
-            return str(raw)
+        return to_json_text(raw)
+
+
+def _load_cached_extraction(cache_dir: str, cache_key: str) -> Optional[Dict[str, Any]]:
+    """Load a cached extraction, ignoring entries without the expected fields or any value."""
+    cached = lookup_cached_extraction(cache_key, cache_dir)
+    if not isinstance(cached, dict) or set(cached) != set(_get_empty_extraction()):
+        return None
+    if not any(isinstance(field, dict) and field.get('value') for field in cached.values()):
+        return None
+    return cached
 
 
 def _get_empty_extraction() -> Dict[str, Any]:
-    """Return empty extraction structure."""
-    fields = [
-        'full_name', 'father_name', 'date_of_birth', 'address', 'phone_number',
-        'email_address', 'aadhaar_number', 'pan_number', 'employee_id', 'account_number'
-    ]
-    return {f: {"value": None, "raw_context": None, "confidence": "low", "source": "none"} for f in fields}
+    """Return empty extraction structure (fresh field dicts, safe to mutate)."""
+    return {f: dict(v) for f, v in _EMPTY_EXTRACTION.items()}
 
 
 def _extract_with_regex_fallback(ocr_text: str, doc_type: str) -> Dict[str, Any]:
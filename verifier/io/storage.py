@@ -7,14 +7,79 @@ Changes:
 - Directory creation list no longer includes any `metrics/*` paths.
 """
 
+import hashlib
 import json
 import os
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, List
+import numpy as np
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
 from verifier.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is the fallback
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Per-document pipeline results, keyed by file fingerprint and doc type
+DOC_CACHE_DIR = "logs/doc_cache"
+# Per-image OCR results, keyed by image hash, doc type and prompt version
+OCR_CACHE_DIR = "logs/ocr_cache"
+# Preprocessed image arrays (.npy), keyed by image hash and preprocessing version
+PREPROC_CACHE_DIR = "logs/preproc_cache"
+# Groq extractions, keyed by prompt version, model, doc type and prompt OCR text
+EXTRACTION_CACHE_DIR = "logs/extraction_cache"
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+)
+
+# Directories already created by this process
+_ENSURED_DIRS = set()
+
+def _ensure_dir(path):
+    """mkdir -p `path`, at most once per process."""
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        Path(key).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+def _dump_json(data: Any, path, indent: bool = True):
+    """
+    Serialize `data` to `path` in one buffered write (orjson when available).
+
+    The file is written next to `path` and renamed over it, so readers never
+    see a partially written JSON file.
+    """
+    buf = None
+    if orjson is not None:
+        try:
+            buf = orjson.dumps(data, option=_ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0))
+        except orjson.JSONEncodeError:
+            buf = None  # e.g. unsupported types; let stdlib json handle or report them
+    if buf is None:
+        buf = json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+    _write_atomic(Path(path), lambda f: f.write(buf))
+
+def _write_atomic(path: Path, write: Callable[[BinaryIO], Any]):
+    """
+    Call `write` on a fresh temp file next to `path`, then rename it over `path`.
+
+    Each call gets its own temp file, so concurrent writers (threads or
+    processes) of the same target never share one.
+    """
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            write(tmp)
+        os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
 def ensure_directories():
     """Create necessary directories."""
     directories = [
@@ -25,12 +90,12 @@ def ensure_directories():
     ]
 
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        _ensure_dir(directory)
 
 def save_ocr_output(engine: str, filename: str, data: Dict[str, Any]):
     """Save OCR output to JSON file."""
     output_dir = f"ocr_outputs/{engine}"
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
 
     output_path = Path(output_dir) / f"{filename}.json"
 
@@ -40,15 +105,14 @@ def save_ocr_output(engine: str, filename: str, data: Dict[str, Any]):
         if key not in ['image_data', 'binary_content']:  # Skip large binary data
             clean_data[key] = value
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(clean_data, f, indent=2, ensure_ascii=False)
+    _dump_json(clean_data, output_path)
 
     logger.info(f"Saved {engine} OCR output: {output_path}")
 
 def save_raw_ocr_text(engine: str, filename: str, ocr_text: str, metadata: Dict[str, Any] = None):
     """Save raw OCR text to a readable text file."""
     output_dir = f"ocr_outputs/{engine}"
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
 
     output_path = Path(output_dir) / f"{filename}.txt"
 
@@ -67,10 +131,9 @@ def save_results(results: List[Dict[str, Any]], output_path: str):
     """Save verification results to JSON file."""
     output_dir = Path(output_path).parent
     if output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_dir)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    _dump_json(results, output_path)
 
     logger.info(f"Saved results to: {output_path}")
 
@@ -82,11 +145,11 @@ def save_metrics(metrics_type: str, filename: str, data: Dict[str, Any]):
     """
     # Put metrics under logs to avoid top-level metrics/ directory
     output_dir = Path("logs") / "metrics" / metrics_type
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
 
     output_path = output_dir / filename
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Metrics are machine-read, so skip indentation
+    _dump_json(data, output_path, indent=False)
 
     logger.debug(f"Saved metrics: {output_path}")
 
@@ -95,6 +158,117 @@ def load_json(filepath: str) -> Dict[str, Any]:
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+def to_json_text(data: Any) -> str:
+    """Serialize structured data (e.g. OCR page dicts) to a JSON string, or str() if it is not serializable."""
+    try:
+        if orjson is not None:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS).decode('utf-8')
+        return json.dumps(data, ensure_ascii=False)
+    except Exception:
+        return str(data)
+
 def get_ocr_output_path(engine: str, filename: str) -> str:
     """Get the path where OCR output would be saved."""
     return f"ocr_outputs/{engine}/{filename}.json"
+
+def document_fingerprint(path: str) -> str:
+    """SHA-256 hex digest of a file's contents, read in 1 MiB chunks."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def document_cache_variant(settings: Dict[str, Any]) -> str:
+    """
+    Short digest of the settings that shape a document's result (models, prompts, engines).
+
+    Results cached under one variant are never served once any of these settings change.
+    """
+    payload = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def _lookup_json_cache(cache_dir: str, key: str) -> Optional[Dict[str, Any]]:
+    """Return the JSON entry stored under `key` in `cache_dir`, or None on a miss or unreadable entry."""
+    path = Path(cache_dir) / f"{key}.json"
+    if not path.exists():
+        return None
+    try:
+        return load_json(str(path))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+
+def _store_json_cache(cache_dir: str, key: str, payload: Dict[str, Any]):
+    """Atomically store `payload` under `key` in `cache_dir`; failures are logged, not raised."""
+    _ensure_dir(cache_dir)
+    path = Path(cache_dir) / f"{key}.json"
+    try:
+        _dump_json(payload, path, indent=False)
+    except Exception as e:
+        logger.warning(f"Failed to write cache entry {path}: {e}")
+        return
+    logger.debug(f"Cached entry: {path}")
+
+def _document_cache_key(fingerprint: str, doc_type: str, variant: str = "") -> str:
+    return f"{fingerprint}_{doc_type}_{variant}" if variant else f"{fingerprint}_{doc_type}"
+
+def lookup_cached_result(fingerprint: str, doc_type: str, variant: str = "") -> Optional[Dict[str, Any]]:
+    """Return the stored result for a document, or None on a miss or unreadable entry."""
+    return _lookup_json_cache(DOC_CACHE_DIR, _document_cache_key(fingerprint, doc_type, variant))
+
+def store_cached_result(fingerprint: str, doc_type: str, result: Dict[str, Any], variant: str = ""):
+    """Store a document's result so identical uploads can skip OCR and extraction."""
+    _store_json_cache(DOC_CACHE_DIR, _document_cache_key(fingerprint, doc_type, variant), result)
+
+
+def ocr_cache_key(image_fingerprint: str, doc_type: str, prompt_version: str) -> str:
+    """Content-addressed OCR cache key: the same image, prompt and doc type hash alike."""
+    return hashlib.sha256(f"{image_fingerprint}|{doc_type}|{prompt_version}".encode('utf-8')).hexdigest()
+
+def lookup_cached_ocr(key: str) -> Optional[Dict[str, Any]]:
+    """Return the stored OCR result for a cache key, or None on a miss or unreadable entry."""
+    return _lookup_json_cache(OCR_CACHE_DIR, key)
+
+def store_cached_ocr(key: str, result: Dict[str, Any]):
+    """Store an OCR result so identical images skip the OCR call."""
+    _store_json_cache(OCR_CACHE_DIR, key, result)
+
+def extraction_cache_key(groq_model: str, doc_type: str, ocr_text: str, prompt_version: str) -> str:
+    """SHA-256 over length-prefixed prompt version, model, doc type and OCR text."""
+    h = hashlib.sha256()
+    for part in (prompt_version, groq_model, doc_type, ocr_text):
+        data = part.encode('utf-8')
+        h.update(len(data).to_bytes(8, 'big'))
+        h.update(data)
+    return h.hexdigest()
+
+def lookup_cached_extraction(key: str, cache_dir: str = EXTRACTION_CACHE_DIR) -> Optional[Dict[str, Any]]:
+    """Return the stored extraction for a cache key, or None on a miss or unreadable entry."""
+    return _lookup_json_cache(cache_dir, key)
+
+def store_cached_extraction(key: str, extracted: Dict[str, Any], cache_dir: str = EXTRACTION_CACHE_DIR):
+    """Store a Groq extraction so identical OCR text skips the Groq call."""
+    _store_json_cache(cache_dir, key, extracted)
+
+def lookup_cached_array(key: str) -> Optional[np.ndarray]:
+    """Return a read-only memory-mapped cached array, or None on a miss or unreadable entry."""
+    path = Path(PREPROC_CACHE_DIR) / f"{key}.npy"
+    if not path.exists():
+        return None
+    try:
+        return np.load(path, mmap_mode='r')
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable array cache entry {path}: {e}")
+        return None
+
+def store_cached_array(key: str, array: np.ndarray):
+    """Store an array as .npy (written to a temp file and renamed into place)."""
+    _ensure_dir(PREPROC_CACHE_DIR)
+    path = Path(PREPROC_CACHE_DIR) / f"{key}.npy"
+    try:
+        _write_atomic(path, lambda f: np.save(f, array, allow_pickle=False))
+    except Exception as e:
+        logger.warning(f"Failed to write array cache entry {path}: {e}")
+        return
+    logger.debug(f"Cached array: {path}")
\ No newline at end of file
@@ -2,7 +2,9 @@
 Text cleaning and confusion correction utilities.
 """
 
+import logging
 import re
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from verifier.utils.logger import get_logger
 
@@ -22,6 +24,37 @@ REVERSE_CONFUSION_MAP = {
     '0': 'O', '5': 'S', '1': 'I', '8': 'B', '2': 'Z'
 }
 
+# Conservative corrections for alphanumeric or unknown fields
+MIXED_CONFUSION_MAP = {
+    'O': '0',  # Capital O to zero in mixed contexts
+    'l': '1',  # Lowercase L to one
+    'I': '1',  # Capital I to one
+}
+
+# Single-pass translation tables built from the maps above
+_NUMERIC_TABLE = str.maketrans(CONFUSION_MAP)
+_ALPHA_TABLE = str.maketrans(REVERSE_CONFUSION_MAP)
+_MIXED_TABLE = str.maketrans(MIXED_CONFUSION_MAP)
+
+# Field-specific correction hints
+_FIELD_HINTS = {
+    'aadhaar_number': 'numeric',
+    'pan_number': 'alphanumeric',
+    'phone_number': 'numeric',
+    'account_number': 'numeric',
+    'employee_id': 'alphanumeric',
+    'full_name': 'alpha',
+    'father_name': 'alpha',
+    'date_of_birth': 'numeric',
+}
+
+# Fields that also carry a `normalized_value` (order-insensitive match key)
+_NAME_FIELDS = frozenset(('full_name', 'father_name'))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_INLINE_SPACE_RE = re.compile(r'[^\S\n]+')
+_BLANK_LINES_RE = re.compile(r' ?\n\s*')
+
 
 def apply_confusion_corrections(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -39,41 +72,25 @@ def apply_confusion_corrections(extracted_data: Dict[str, Any]) -> Dict[str, Any
         return extracted_data
     
     corrected_data = {}
-    
-    # Field-specific correction hints
-    field_hints = {
-        'aadhaar_number': 'numeric',
-        'pan_number': 'alphanumeric',
-        'phone_number': 'numeric',
-        'account_number': 'numeric',
-        'employee_id': 'alphanumeric',
-        'full_name': 'alpha',
-        'father_name': 'alpha',
-        'date_of_birth': 'numeric',
-    }
+    debug = logger.isEnabledFor(logging.DEBUG)  # skip building log strings at INFO
     
     for field_name, field_data in extracted_data.items():
-        if not isinstance(field_data, dict):
-            corrected_data[field_name] = field_data
-            continue
-        
-        # Copy the field data
-        corrected_field = field_data.copy()
-        
-        # Apply corrections to the value if it's a string
-        if 'value' in field_data and field_data['value']:
-            value = field_data['value']
-            
-            # Only correct string values
-            if isinstance(value, str):
-                hint = field_hints.get(field_name, None)
-                corrected_value = correct_text(value, hint)
-                
-                if corrected_value != value:
+        value = field_data.get('value') if isinstance(field_data, dict) else None
+
+        # Only correct non-empty string values; everything else is passed through as-is
+        if value and isinstance(value, str):
+            corrected_value = correct_text(value, _FIELD_HINTS.get(field_name))
+            updates = {}
+            if corrected_value != value:
+                if debug:
                     logger.debug(f"Corrected {field_name}: '{value}' -> '{corrected_value}'")
-                    corrected_field['value'] = corrected_value
-        
-        corrected_data[field_name] = corrected_field
+                updates['value'] = corrected_value
+            if field_name in _NAME_FIELDS:
+                updates['normalized_value'] = name_match_key(corrected_value)
+            if updates:
+                field_data = {**field_data, **updates}
+
+        corrected_data[field_name] = field_data
     
     return corrected_data
 
@@ -91,30 +108,49 @@ def correct_text(text: str, field_hint: Optional[str] = None) -> str:
     """
     if not text or not isinstance(text, str):
         return text
-    
-    original_text = text
-    
-    if field_hint == 'numeric':
-        # Apply corrections for numeric fields
-        for wrong, correct in CONFUSION_MAP.items():
-            text = text.replace(wrong, correct)
-    
-    elif field_hint == 'alpha':
-        # Apply reverse corrections for alpha fields
-        for wrong, correct in REVERSE_CONFUSION_MAP.items():
-            text = text.replace(wrong, correct)
-    
-    else:  # alphanumeric or unknown
-        # Be more conservative, only apply obvious corrections
-        corrections = {
-            'O': '0',  # Capital O to zero in mixed contexts
-            'l': '1',  # Lowercase L to one
-            'I': '1',  # Capital I to one
-        }
-        for wrong, correct in corrections.items():
-            text = text.replace(wrong, correct)
-    
-    return text
+    return _correct_text_cached(text, field_hint)
+
+
+@lru_cache(maxsize=4096)
+def _correct_text_cached(text: str, field_hint: Optional[str]) -> str:
+    """Memoized correction; names and IDs repeat across a batch of documents."""
+    return _CORRECTORS.get(field_hint, _correct_mixed)(text)
+
+
+@lru_cache(maxsize=4096)
+def name_match_key(name: str) -> str:
+    """
+    Order- and case-insensitive comparison key for a person name.
+
+    "Doe John" and "john doe" both map to "doe john"; duplicate tokens collapse.
+    """
+    return ' '.join(sorted(set(name.lower().split())))
+
+
+def _make_corrector(table: Dict[int, Any], is_clean=None):
+    """
+    Build a corrector that translates non-empty strings with `table` in one pass.
+
+    `is_clean` (e.g. str.isdigit) identifies text the table cannot change,
+    which is returned as-is without scanning it again.
+    """
+    def corrector(text):
+        if not text or not isinstance(text, str):
+            return text
+        if is_clean is not None and is_clean(text):
+            return text
+        return text.translate(table)
+    return corrector
+
+
+# Numeric fields get the full confusion map, alpha fields the reverse map, and
+# alphanumeric or unknown fields only the conservative mixed corrections
+_correct_mixed = _make_corrector(_MIXED_TABLE)
+_CORRECTORS = {
+    'numeric': _make_corrector(_NUMERIC_TABLE, str.isdigit),
+    'alpha': _make_corrector(_ALPHA_TABLE, str.isalpha),
+    'alphanumeric': _correct_mixed,
+}
 
 
 def clean_whitespace(text: str) -> str:
@@ -123,7 +159,17 @@ def clean_whitespace(text: str) -> str:
         return text
     
     # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
+    return text.strip()
+
+
+def compact_whitespace(text: str) -> str:
+    """Collapse runs of spaces/tabs and blank lines, keeping single line breaks."""
+    if not text:
+        return text
+
+    text = _INLINE_SPACE_RE.sub(' ', text)
+    text = _BLANK_LINES_RE.sub('\n', text)
     return text.strip()
 
 
@@ -141,9 +187,12 @@ def remove_special_characters(text: str, keep_chars: str = "") -> str:
     if not text:
         return text
     
+    return _special_chars_re(keep_chars).sub('', text)
+
+
+@lru_cache(maxsize=32)
+def _special_chars_re(keep_chars: str) -> re.Pattern:
+    """Compiled pattern matching everything except alphanumerics and `keep_chars`."""
     # Escape special regex characters in keep_chars
     escaped_keep = re.escape(keep_chars)
-    pattern = f'[^a-zA-Z0-9{escaped_keep}]'
-    
-    cleaned = re.sub(pattern, '', text)
-    return cleaned
\ No newline at end of file
+    return re.compile(f'[^a-zA-Z0-9{escaped_keep}]')
\ No newline at end of file
@@ -3,10 +3,11 @@ Field-specific normalization functions.
 """
 
 import re
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from verifier.utils.logger import get_logger
-from verifier.normalize.cleaners import apply_confusion_corrections, clean_whitespace
+from verifier.normalize.cleaners import correct_text, clean_whitespace
 
 logger = get_logger(__name__)
 
@@ -39,6 +40,67 @@ PAN_PATTERN = r'[A-Z]{5}[0-9]{4}[A-Z]'
 AADHAAR_PATTERN = r'\b[0-9]{4}\s?[0-9]{4}\s?[0-9]{4}\b'
 EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
 
+# Normalizers are pure functions of their input, so repeated OCR values
+# (same PAN, DOB or city across pages and re-runs) are served from an LRU cache
+NORMALIZER_CACHE_SIZE = 10000
+_ADDRESS_FIELDS = ("house", "street", "city", "state", "pincode")
+
+# Compiled once at import; the normalizers run for every extracted field
+_DATE_RES = [re.compile(p, re.IGNORECASE) for p in DATE_PATTERNS]
+# All layouts in one alternation, each wrapped in a named group (layout0, layout1, ...)
+_DATE_COMBINED_RE = re.compile(
+    '|'.join(f'(?P<layout{i}>{p})' for i, p in enumerate(DATE_PATTERNS)), re.IGNORECASE
+)
+_PAN_RE = re.compile(PAN_PATTERN)
+_NON_DIGIT_RE = re.compile(r'\D')
+_NON_ALNUM_RE = re.compile(r'[^A-Z0-9]')
+_NON_EMPID_RE = re.compile(r'[^A-Z0-9\-]')
+_EMP_PREFIX_RE = re.compile(r'^(EMP|ID|STAFF|EMPLOYEE)[\s\-_]*', re.IGNORECASE)
+_PINCODE_RE = re.compile(r'\b[1-9][0-9]{5}\b')
+_COMMA_SPLIT_RE = re.compile(r'\s*,\s*')
+_HOUSE_RE = re.compile(r'^(\d+[A-Za-z]?)\b')
+_EMAIL_LOCAL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+$')
+_EMAIL_DOMAIN_RE = re.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Common Indian cities (with their state) and states for better address identification
+_CITY_STATE = {
+    'bangalore': 'Karnataka',
+    'mumbai': 'Maharashtra',
+    'delhi': 'Delhi',
+    'chennai': 'Tamil Nadu',
+    'kolkata': 'West Bengal',
+    'hyderabad': 'Telangana',
+    'pune': 'Maharashtra',
+}
+_STATES = dict.fromkeys(['karnataka', 'maharashtra', 'tamil nadu', 'west bengal', 'andhra pradesh', 'delhi'])
+
+# Common OCR errors in employee IDs (applied after upper-casing)
+_EMPID_TRANS = str.maketrans({
+    'O': '0',  # Letter O to zero
+    'I': '1',  # Letter I to one
+    'L': '1',  # Letter L to one
+    'S': '5',  # Letter S to five
+    'B': '8',  # Letter B to eight
+})
+
+# Common domain OCR errors in emails, fixed in one pass
+EMAIL_DOMAIN_CORRECTIONS = {
+    'gma1l.': 'gmail.',
+    'gmai1.': 'gmail.',
+    'yah0o.': 'yahoo.',
+    'yaho0.': 'yahoo.',
+    'hotma1l.': 'hotmail.',
+    'out1ook.': 'outlook.',
+    'ema1l.': 'email.',
+}
+_EMAIL_DOMAIN_FIX_RE = re.compile('|'.join(map(re.escape, EMAIL_DOMAIN_CORRECTIONS)))
+
+_ORDINAL_SUFFIXES = frozenset(('st', 'nd', 'rd', 'th'))
+_HAS_ALPHA_RE = re.compile(r'[A-Za-z]')
+_FOUR_DIGITS_RE = re.compile(r'\d{4}')
+_TWO_DIGITS_RE = re.compile(r'\d{2}')
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_phone(raw_phone: str) -> Optional[str]:
     """
     Normalize phone number to standard format.
@@ -53,8 +115,8 @@ def normalize_phone(raw_phone: str) -> Optional[str]:
         return None
     
     # Clean and extract digits
-    cleaned = apply_confusion_corrections(raw_phone, 'numeric')
-    digits = re.sub(r'\D', '', cleaned)
+    cleaned = correct_text(raw_phone, 'numeric')
+    digits = _NON_DIGIT_RE.sub('', cleaned)
     
     # Handle Indian phone numbers specifically
     if len(digits) == 10:
@@ -63,19 +125,16 @@ def normalize_phone(raw_phone: str) -> Optional[str]:
         return f"+91{digits[1:]}"
     elif len(digits) == 12 and digits.startswith('91'):
         return f"+{digits}"
-    elif len(digits) == 13 and digits.startswith('+91'):
-        return f"+{digits[1:]}"
     elif len(digits) == 13 and not digits.startswith('91'):
-        # This might be a malformed number, try to extract last 10 digits
-        last_10 = digits[-10:]
-        if last_10.isdigit():
-            return f"+91{last_10}"
+        # This might be a malformed number, keep the last 10 digits
+        return f"+91{digits[-10:]}"
     elif 10 <= len(digits) <= 15:
         return f"+{digits}"
     else:
         logger.debug(f"Invalid phone number length: {len(digits)} for {raw_phone}")
         return None
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_pan(raw_pan: str) -> Optional[str]:
     """
     Normalize PAN number.
@@ -90,16 +149,17 @@ def normalize_pan(raw_pan: str) -> Optional[str]:
         return None
     
     # Clean and uppercase
-    cleaned = apply_confusion_corrections(raw_pan.upper(), 'alphanumeric')
-    cleaned = re.sub(r'[^A-Z0-9]', '', cleaned)
+    cleaned = correct_text(raw_pan.upper(), 'alphanumeric')
+    cleaned = _NON_ALNUM_RE.sub('', cleaned)
     
     # Validate format
-    if re.match(PAN_PATTERN, cleaned):
+    if _PAN_RE.match(cleaned):
         return cleaned
     else:
         logger.debug(f"Invalid PAN format: {raw_pan}")
         return None
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_aadhaar(raw_aadhaar: str) -> Optional[str]:
     """
     Normalize Aadhaar number (12 digits).
@@ -114,8 +174,8 @@ def normalize_aadhaar(raw_aadhaar: str) -> Optional[str]:
         return None
     
     # Clean and extract digits
-    cleaned = apply_confusion_corrections(raw_aadhaar, 'numeric')
-    digits = re.sub(r'\D', '', cleaned)
+    cleaned = correct_text(raw_aadhaar, 'numeric')
+    digits = _NON_DIGIT_RE.sub('', cleaned)
     
     if len(digits) == 12:
         return digits
@@ -133,6 +193,17 @@ def canonicalize_address(raw_address: str) -> Dict[str, Optional[str]]:
     Returns:
         Dict with house, street, city, state, pincode
     """
+    # The memoized parse returns an immutable tuple; every caller gets a fresh dict
+    return dict(zip(_ADDRESS_FIELDS, _canonicalize_address_cached(raw_address)))
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
+def _canonicalize_address_cached(raw_address: str) -> tuple:
+    """Parsed address as a tuple ordered like _ADDRESS_FIELDS."""
+    parsed = _parse_address(raw_address)
+    return tuple(parsed[field] for field in _ADDRESS_FIELDS)
+
+def _parse_address(raw_address: str) -> Dict[str, Optional[str]]:
+    """Uncached address parsing behind `canonicalize_address`."""
     if not raw_address:
         return {
             "house": None,
@@ -145,14 +216,14 @@ def canonicalize_address(raw_address: str) -> Dict[str, Optional[str]]:
     cleaned = clean_whitespace(raw_address)
     
     # Extract pincode (6 digits)
-    pincode_match = re.search(r'\b[1-9][0-9]{5}\b', cleaned)
+    pincode_match = _PINCODE_RE.search(cleaned)
     pincode = pincode_match.group() if pincode_match else None
     
     # Remove pincode from address for better parsing
-    address_without_pincode = re.sub(r'\b[1-9][0-9]{5}\b', '', cleaned).strip()
+    address_without_pincode = _PINCODE_RE.sub('', cleaned).strip()
     
     # Simple heuristic parsing
-    parts = [part.strip() for part in address_without_pincode.split(',')]
+    parts = _COMMA_SPLIT_RE.split(address_without_pincode)
     
     result = {
         "house": None,
@@ -165,7 +236,7 @@ def canonicalize_address(raw_address: str) -> Dict[str, Optional[str]]:
     if len(parts) >= 2:
         # Try to extract house number from first part
         first_part = parts[0]
-        house_match = re.search(r'^(\d+[A-Za-z]?)\b', first_part)
+        house_match = _HOUSE_RE.search(first_part)
         if house_match:
             result["house"] = house_match.group(1)
             result["street"] = first_part.replace(house_match.group(1), '').strip()
@@ -182,42 +253,34 @@ def canonicalize_address(raw_address: str) -> Dict[str, Optional[str]]:
         # Single part address
         result["street"] = address_without_pincode
     
-    # Common Indian cities and states for better identification
-    indian_cities = ['bangalore', 'mumbai', 'delhi', 'chennai', 'kolkata', 'hyderabad', 'pune']
-    indian_states = ['karnataka', 'maharashtra', 'tamil nadu', 'west bengal', 'andhra pradesh', 'delhi']
-    
     # Improve city/state detection
-    if result["city"]:
-        city_lower = result["city"].lower()
-        for city in indian_cities:
-            if city in city_lower:
-                result["city"] = city.title()
-                break
+    city = _lookup_known(result["city"].lower(), _CITY_STATE) if result["city"] else None
+    if city:
+        result["city"] = city.title()
     
     if result["state"]:
-        state_lower = result["state"].lower()
-        for state in indian_states:
-            if state in state_lower:
-                result["state"] = state.title()
-                break
-    elif result["city"] and not result["state"]:
+        state = _lookup_known(result["state"].lower(), _STATES)
+        if state:
+            result["state"] = state.title()
+    elif city:
         # Infer state from city
-        city_state_map = {
-            'bangalore': 'Karnataka',
-            'mumbai': 'Maharashtra', 
-            'delhi': 'Delhi',
-            'chennai': 'Tamil Nadu',
-            'kolkata': 'West Bengal',
-            'hyderabad': 'Telangana',
-            'pune': 'Maharashtra'
-        }
-        for city, state in city_state_map.items():
-            if city in result["city"].lower():
-                result["state"] = state
-                break
+        result["state"] = _CITY_STATE[city]
     
     return result
 
+def _lookup_known(text_lower: str, known: Dict[str, Any]) -> Optional[str]:
+    """Find a known city/state name in `text_lower`: whole-text or token hash lookups, then substring scan."""
+    if text_lower in known:
+        return text_lower
+    for token in text_lower.split():
+        if token in known:
+            return token
+    for name in known:
+        if name in text_lower:
+            return name
+    return None
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_employee_id(raw_emp_id: str) -> Optional[str]:
     """
     Normalize employee ID.
@@ -235,22 +298,13 @@ def normalize_employee_id(raw_emp_id: str) -> Optional[str]:
     cleaned = clean_whitespace(raw_emp_id.upper())
     
     # Remove common prefixes if they exist
-    cleaned = re.sub(r'^(EMP|ID|STAFF|EMPLOYEE)[\s\-_]*', '', cleaned, flags=re.IGNORECASE)
+    cleaned = _EMP_PREFIX_RE.sub('', cleaned)
     
     # Fix common OCR errors
-    corrections = {
-        'O': '0',  # Letter O to zero
-        'I': '1',  # Letter I to one
-        'L': '1',  # Letter L to one
-        'S': '5',  # Letter S to five
-        'B': '8',  # Letter B to eight
-    }
-    
-    for wrong, correct in corrections.items():
-        cleaned = cleaned.replace(wrong, correct)
+    cleaned = cleaned.translate(_EMPID_TRANS)
     
     # Remove any remaining special characters except hyphens (for IDs like EMP-001)
-    cleaned = re.sub(r'[^A-Z0-9\-]', '', cleaned)
+    cleaned = _NON_EMPID_RE.sub('', cleaned)
     
     # Validate length and format
     if len(cleaned) >= 2:  # Reasonable minimum length for employee ID
@@ -259,6 +313,7 @@ def normalize_employee_id(raw_emp_id: str) -> Optional[str]:
         logger.debug(f"Employee ID too short: {cleaned} (original: {raw_emp_id})")
         return None
     
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_email(raw_email: str) -> Optional[str]:
     """
     Normalize email address.
@@ -275,30 +330,12 @@ def normalize_email(raw_email: str) -> Optional[str]:
     # Clean whitespace and convert to lowercase
     cleaned = clean_whitespace(raw_email.lower())
     
-    # Fix common OCR errors in emails
-    corrections = {
-        ' ': '.',  # Spaces often represent dots in names
-        '..': '.',  # Remove double dots
-        ' .': '.',  # Fix space before dot
-        '. ': '.',  # Fix space after dot
-    }
-    
-    for wrong, correct in corrections.items():
-        cleaned = cleaned.replace(wrong, correct)
+    # Fix common OCR errors in emails: spaces often represent dots in names
+    # (whitespace is already single, so ' .' / '. ' collapse via '..' -> '.')
+    cleaned = cleaned.replace(' ', '.').replace('..', '.')
     
     # Fix common domain OCR errors
-    domain_corrections = {
-        'gma1l.': 'gmail.',
-        'gmai1.': 'gmail.', 
-        'yah0o.': 'yahoo.',
-        'yaho0.': 'yahoo.',
-        'hotma1l.': 'hotmail.',
-        'out1ook.': 'outlook.',
-        'ema1l.': 'email.',
-    }
-    
-    for wrong, correct in domain_corrections.items():
-        cleaned = cleaned.replace(wrong, correct)
+    cleaned = _EMAIL_DOMAIN_FIX_RE.sub(lambda m: EMAIL_DOMAIN_CORRECTIONS[m.group(0)], cleaned)
     
     # Ensure proper email format
     if '@' not in cleaned:
@@ -308,20 +345,18 @@ def normalize_email(raw_email: str) -> Optional[str]:
     local_part, domain_part = cleaned.split('@', 1)
     
     # Validate local part (before @)
-    if not re.match(r'^[a-zA-Z0-9._%+-]+$', local_part):
+    if not _EMAIL_LOCAL_RE.match(local_part):
         return None
     
     # Validate domain part (after @)
-    if not re.match(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', domain_part):
+    if not _EMAIL_DOMAIN_RE.match(domain_part):
         # Try to fix missing TLD
         if '.' not in domain_part:
             domain_part += '.com'
             cleaned = f"{local_part}@{domain_part}"
     
     # Final validation
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if re.match(email_pattern, cleaned):
+    if _EMAIL_RE.match(cleaned):
         return cleaned
     else:
         logger.debug(f"Invalid email format after normalization: {cleaned}")
@@ -330,14 +365,19 @@ def normalize_email(raw_email: str) -> Optional[str]:
 def _normalize_two_digit_year(y: str) -> str:
     """Convert 2-digit year to 4-digit (assume 2000s)."""
     y = y.strip()
-    if len(y) == 2:
-        return f"20{y}"
+    n = len(y)
+    if n == 4:
+        return y
+    if n == 2:
+        return "20" + y
     return y.zfill(4)
 
 def _strip_ordinal(day_str: str) -> str:
     """Remove ordinal suffixes like 1st, 2nd, 3rd, 4th."""
-    return re.sub(r'(st|nd|rd|th)$', '', day_str, flags=re.IGNORECASE)
+    # Plain slice + set lookup (case-insensitive), no regex engine
+    return day_str[:-2] if day_str[-2:].lower() in _ORDINAL_SUFFIXES else day_str
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_name(raw_name: str) -> str:
     """
     Normalize person name (title case, clean whitespace).
@@ -362,6 +402,7 @@ def normalize_name(raw_name: str) -> str:
     
     return ' '.join(parts)
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def normalize_date(raw_date: str) -> Optional[str]:
     """
     Normalize date to YYYY-MM-DD format.
@@ -373,100 +414,122 @@ def normalize_date(raw_date: str) -> Optional[str]:
     cleaned = clean_whitespace(raw_date)
     cleaned = cleaned.replace(',', ' ')  # allow "January 12, 2020" forms
 
-    for pattern in DATE_PATTERNS:
-        match = re.search(pattern, cleaned, flags=re.IGNORECASE)
-        if not match:
-            continue
-
-        try:
-            parts = [p.strip() for p in match.groups()]
-
-            # Normalize parts: remove ordinals from day
-            parts = [ _strip_ordinal(p) for p in parts ]
-
-            # Detect which part is year / month / day by content
-            # If any part contains letters -> it's a month name
-            month_idx = None
-            for i, p in enumerate(parts):
-                if re.search(r'[A-Za-z]', p):
-                    month_idx = i
-                    break
-
-            if month_idx is not None:
-                # We have a month-name style date. Map month name to number.
-                # Identify day and year among remaining parts
-                # Common layouts we covered:
-                #  - [DD, Month, YYYY]  -> parts[0]=day, parts[1]=month, parts[2]=year
-                #  - [Month, DD, YYYY]  -> parts[0]=month, parts[1]=day, parts[2]=year
-                #  - [DD, Month, YY]    -> same with 2-digit year
-
-                # month string -> month number
-                month_str = parts[month_idx].lower()
-                month_num = MONTH_MAP.get(month_str[:3], None) or MONTH_MAP.get(month_str, None)
-                # try full lookup fallback
-                if not month_num:
-                    month_num = MONTH_MAP.get(month_str, None)
-
-                if not month_num:
-                    # try to match common abbreviation first 3 letters
-                    month_num = MONTH_MAP.get(month_str[:3], None)
-
-                if not month_num:
-                    # unknown month name — skip this pattern
-                    continue
-
-                # Determine day and year indexes (the other two)
-                idxs = [0,1,2]
-                idxs.remove(month_idx)
-                # heuristics: year is the one with length 4 or numeric > 31
-                year_idx = None
-                day_idx = None
-                for i in idxs:
-                    p = parts[i]
-                    if re.fullmatch(r'\d{4}', p):
-                        year_idx = i
-                    elif re.fullmatch(r'\d{2}', p) and int(p) > 31:
-                        # two-digit but looks like year
-                        year_idx = i
-                if year_idx is None:
-                    # fallback: last part often year
-                    year_idx = idxs[-1]
-                idxs.remove(year_idx)
-                day_idx = idxs[0]
-
-                day = parts[day_idx].zfill(2)
-                year = _normalize_two_digit_year(parts[year_idx])
-                month = month_num
-
-                # validate and return
-                datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-                return f"{year}-{month}-{day}"
+    # Fast path: one scan over all layouts; the leftmost match is usually the date
+    match = _DATE_COMBINED_RE.search(cleaned)
+    if match:
+        first = _DATE_COMBINED_RE.groupindex[match.lastgroup] + 1
+        normalized = _parse_date_parts(match.group(first, first + 1, first + 2))
+        if normalized:
+            return normalized
 
-            else:
-                # Numeric-style date (no month names)
-                # Determine if format is YYYY-MM-DD or DD-MM-YYYY by length
-                a, b, c = parts
-                # If first part length == 4 -> assume YYYY-MM-DD
-                if len(a) == 4:
-                    year, month, day = a, b, c
-                elif len(c) == 4:
-                    day, month, year = a, b, c
-                else:
-                    # two-digit year handling
-                    day, month, year = a, b, c
-                    year = _normalize_two_digit_year(year)
-
-                # zfill and validate
-                month = month.zfill(2)
-                day = day.zfill(2)
-                year = year.zfill(4)
-
-                datetime.strptime(f"{year}-{month}-{day}", "%Y-%m-%d")
-                return f"{year}-{month}-{day}"
-
-        except (ValueError, IndexError):
-            # try next pattern if conversion/validation fails
-            continue
+        # That candidate did not validate; try each layout in priority order
+        for pattern in _DATE_RES:
+            match = pattern.search(cleaned)
+            if match:
+                normalized = _parse_date_parts(match.groups())
+                if normalized:
+                    return normalized
 
     logger.debug(f"Could not normalize date: {raw_date}")
-    return None
\ No newline at end of file
+    return None
+
+def _check_date(year: str, month: str, day: str):
+    """Raise ValueError unless the parts form a real YYYY-M(M)-D(D) calendar date."""
+    # Same shape rules as strptime("%Y-%m-%d"): 4-digit year, 1-2 digit month/day,
+    # ASCII digits only
+    digits = year + month + day
+    if not (len(year) == 4 and 0 < len(month) <= 2 and 0 < len(day) <= 2
+            and digits.isascii() and digits.isdigit()):
+        raise ValueError(f"Malformed date parts: {year}-{month}-{day}")
+    date(int(year), int(month), int(day))
+
+def _parse_date_parts(parts) -> Optional[str]:
+    """Turn the three captured date parts into YYYY-MM-DD, or None if they don't form a valid date."""
+    try:
+        parts = [p.strip() for p in parts]
+
+        # Normalize parts: remove ordinals from day
+        parts = [ _strip_ordinal(p) for p in parts ]
+
+        # Detect which part is year / month / day by content
+        # If any part contains letters -> it's a month name
+        month_idx = None
+        for i, p in enumerate(parts):
+            if _HAS_ALPHA_RE.search(p):
+                month_idx = i
+                break
+
+        if month_idx is not None:
+            # We have a month-name style date. Map month name to number.
+            # Identify day and year among remaining parts
+            # Common layouts we covered:
+            #  - [DD, Month, YYYY]  -> parts[0]=day, parts[1]=month, parts[2]=year
+            #  - [Month, DD, YYYY]  -> parts[0]=month, parts[1]=day, parts[2]=year
+            #  - [DD, Month, YY]    -> same with 2-digit year
+
+            # month string -> month number; every MONTH_MAP key's 3-letter
+            # prefix is itself a key, so one prefix lookup covers full names too
+            month_num = MONTH_MAP.get(parts[month_idx][:3].lower())
+
+            if not month_num:
+                # unknown month name — not a date in this layout
+                return None
+
+            # Determine day and year indexes (the other two)
+            idxs = [0,1,2]
+            idxs.remove(month_idx)
+            # heuristics: year is the one with length 4 or numeric > 31
+            year_idx = None
+            day_idx = None
+            for i in idxs:
+                p = parts[i]
+                if _FOUR_DIGITS_RE.fullmatch(p):
+                    year_idx = i
+                elif _TWO_DIGITS_RE.fullmatch(p) and int(p) > 31:
+                    # two-digit but looks like year
+                    year_idx = i
+            if year_idx is None:
+                # fallback: last part often year
+                year_idx = idxs[-1]
+            idxs.remove(year_idx)
+            day_idx = idxs[0]
+
+            day = parts[day_idx].zfill(2)
+            year = _normalize_two_digit_year(parts[year_idx])
+            month = month_num
+
+            # validate and return
+            _check_date(year, month, day)
+            return f"{year}-{month}-{day}"
+
+        else:
+            # Numeric-style date (no month names)
+            # Determine if format is YYYY-MM-DD or DD-MM-YYYY by length
+            a, b, c = parts
+            # If first part length == 4 -> assume YYYY-MM-DD
+            if len(a) == 4:
+                year, month, day = a, b, c
+            elif len(c) == 4:
+                day, month, year = a, b, c
+            else:
+                # two-digit year handling
+                day, month, year = a, b, c
+                year = _normalize_two_digit_year(year)
+
+            # zfill and validate
+            month = month.zfill(2)
+            day = day.zfill(2)
+            year = year.zfill(4)
+
+            _check_date(year, month, day)
+            return f"{year}-{month}-{day}"
+
+    except (ValueError, IndexError):
+        # conversion/validation failed
+        return None
+
+def clear_normalizer_caches():
+    """Drop all memoized normalizer results (e.g. between tests)."""
+    for fn in (normalize_phone, normalize_pan, normalize_aadhaar, normalize_employee_id,
+               normalize_email, normalize_name, normalize_date, _canonicalize_address_cached):
+        fn.cache_clear()
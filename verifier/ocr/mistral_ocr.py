@@ -2,20 +2,67 @@
 Official Mistral AI OCR implementation using their API.
 """
 
+import asyncio
 import base64
+import mimetypes
+import mmap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from pathlib import Path  # ADD THIS IMPORT
+import httpx
 from mistralai import Mistral
 from verifier.utils.logger import get_logger
+from verifier.utils.async_http import LoopBoundClient
 from verifier.io.storage import save_ocr_output, save_raw_ocr_text
 
 logger = get_logger(__name__)
 
+def image_to_data_url(image_path: str) -> str:
+    """
+    Base64-encode an image file into a data URL for the Mistral API.
+
+    The file is memory-mapped rather than read into a bytes copy, and the
+    MIME type comes from the file extension (JPEG if unknown).
+    """
+    mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
+    with open(image_path, "rb") as image_file:
+        try:
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                encoded = base64.b64encode(mapped)
+        except ValueError:  # empty files cannot be mapped
+            encoded = base64.b64encode(image_file.read())
+    return f"data:{mime_type};base64,{encoded.decode('ascii')}"
+
+def split_ocr_lines(full_text: str) -> List[Dict[str, Any]]:
+    """
+    Split OCR text into non-empty line records.
+
+    Mistral returns plain text, so confidence and bbox are fixed placeholders
+    (bbox is a synthetic 20px row per source line).
+    """
+    lines = []
+    for i, line_text in enumerate(full_text.split('\n')):
+        clean_text = line_text.strip()
+        if clean_text:
+            lines.append({
+                'text': clean_text,
+                'confidence': 95.0,
+                'bbox': [0, i * 20, 100, 20],
+                'line_number': i
+            })
+    return lines
+
 class MistralOCR:
     def __init__(self, api_key: str):
         """Initialize Mistral AI client."""
-        self.client = Mistral(api_key=api_key)
+        self._http = httpx.Client(follow_redirects=True)
+        self.client = Mistral(api_key=api_key, client=self._http)
+        # Async SDK client, rebuilt for each event loop (e.g. every asyncio.run)
+        self._async_client = LoopBoundClient(
+            lambda http: Mistral(api_key=api_key, client=self._http, async_client=http),
+            follow_redirects=True
+        )
         logger.info("Mistral AI OCR initialized")
     
     def run_ocr(self, image_path: str, save_output: bool = True) -> Dict[str, Any]:
@@ -32,103 +79,113 @@ class MistralOCR:
         start_time = time.time()
         
         try:
-            # Read and encode image
-            with open(image_path, "rb") as image_file:
-                image_data = image_file.read()
-            
-            # Convert to base64
-            base64_image = base64.b64encode(image_data).decode('utf-8')
-            
-            # Prepare messages for OCR
-            messages = [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "Extract all text from this document image. Return the text exactly as it appears, preserving line breaks and formatting. Do not interpret or modify the text."
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": f"data:image/jpeg;base64,{base64_image}"
-                        }
-                    ]
-                }
-            ]
-            
             # Call Mistral API for OCR
             response = self.client.chat.complete(
                 model="mistral-large-latest",
-                messages=messages,
+                messages=self._build_messages(image_path),
                 max_tokens=4000
             )
+            return self._build_result(response, image_path, start_time, save_output)
+        except Exception as e:
+            return self._error_result(e, start_time)
+
+    async def run_ocr_async(self, image_path: str, save_output: bool = True) -> Dict[str, Any]:
+        """Async variant of `run_ocr`; the API call does not block the event loop."""
+        start_time = time.time()
+
+        try:
+            response = await self._async_client.get().chat.complete_async(
+                model="mistral-large-latest",
+                messages=self._build_messages(image_path),
+                max_tokens=4000
+            )
+            return self._build_result(response, image_path, start_time, save_output)
+        except Exception as e:
+            return self._error_result(e, start_time)
+
+    def _build_messages(self, image_path: str) -> list:
+        """Prepare OCR messages with the encoded image."""
+        # Read and encode image
+        image_url = image_to_data_url(image_path)
+
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "Extract all text from this document image. Return the text exactly as it appears, preserving line breaks and formatting. Do not interpret or modify the text."
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": image_url
+                    }
+                ]
+            }
+        ]
+
+    def _build_result(self, response, image_path: str, start_time: float, save_output: bool) -> Dict[str, Any]:
+        """Turn a chat completion into the OCR result dict, saving it if requested."""
+        processing_time = (time.time() - start_time) * 1000
+        
+        # Extract OCR text from response
+        if response and response.choices:
+            full_text = response.choices[0].message.content
             
-            processing_time = (time.time() - start_time) * 1000
+            # Process into lines
+            lines = split_ocr_lines(full_text)
+            word_count = len(full_text.split())
             
-            # Extract OCR text from response
-            if response and response.choices:
-                full_text = response.choices[0].message.content
-                
-                # Process into lines
-                lines = []
-                for i, line_text in enumerate(full_text.split('\n')):
-                    if line_text.strip():
-                        lines.append({
-                            'text': line_text.strip(),
-                            'confidence': 95.0,
-                            'bbox': [0, i * 20, 100, 20],
-                            'line_number': i
-                        })
-                
-                result = {
-                    "raw_text": full_text,
-                    "lines": lines,
-                    "time_ms": processing_time,
-                    "word_count": len(full_text.split()),
-                    "success": True,
-                    "engine": "mistral_api",
+            result = {
+                "raw_text": full_text,
+                "lines": lines,
+                "time_ms": processing_time,
+                "word_count": word_count,
+                "success": True,
+                "engine": "mistral_api",
+                "image_path": image_path,
+                "timestamp": time.time()
+            }
+            
+            # Save OCR output to file
+            if save_output:
+                filename = Path(image_path).stem
+                save_ocr_output("mistral", filename, result)
+                save_raw_ocr_text("mistral", filename, full_text, {
                     "image_path": image_path,
-                    "timestamp": time.time()
-                }
-                
-                # Save OCR output to file
-                if save_output:
-                    filename = Path(image_path).stem
-                    save_ocr_output("mistral", filename, result)
-                    save_raw_ocr_text("mistral", filename, full_text, {
-                        "image_path": image_path,
-                        "processing_time_ms": processing_time,
-                        "lines_extracted": len(lines),
-                        "word_count": len(full_text.split())
-                    })
-                
-                logger.info(f"Mistral OCR completed in {processing_time:.2f}ms, extracted {len(lines)} lines, {len(full_text)} chars")
-                return result
-            else:
-                logger.warning("No text detected by Mistral OCR")
-                result = {
-                    "raw_text": "",
-                    "lines": [],
-                    "time_ms": processing_time,
-                    "success": False,
-                    "error": "No text detected",
-                    "engine": "mistral_api"
-                }
-                return result
-                
-        except Exception as e:
-            logger.error(f"Mistral OCR failed: {e}")
-            processing_time = (time.time() - start_time) * 1000
+                    "processing_time_ms": processing_time,
+                    "lines_extracted": len(lines),
+                    "word_count": word_count
+                })
+            
+            logger.info(f"Mistral OCR completed in {processing_time:.2f}ms, extracted {len(lines)} lines, {len(full_text)} chars")
+            return result
+        else:
+            logger.warning("No text detected by Mistral OCR")
             result = {
                 "raw_text": "",
                 "lines": [],
                 "time_ms": processing_time,
                 "success": False,
-                "error": str(e),
+                "error": "No text detected",
                 "engine": "mistral_api"
             }
             return result
 
+    def _error_result(self, error: Exception, start_time: float) -> Dict[str, Any]:
+        """Failure result for an OCR call that raised."""
+        logger.error(f"Mistral OCR failed: {error}")
+        processing_time = (time.time() - start_time) * 1000
+        result = {
+            "raw_text": "",
+            "lines": [],
+            "time_ms": processing_time,
+            "success": False,
+            "error": str(error),
+            "engine": "mistral_api"
+        }
+        return result
+
 # Global instance
 _mistral_ocr = None
 
@@ -152,4 +209,64 @@ def run_mistral_ocr(image_path: str, api_key: str, save_output: bool = True) ->
         Dict with OCR results
     """
     ocr_engine = get_mistral_ocr(api_key)
-    return ocr_engine.run_ocr(image_path, save_output)
\ No newline at end of file
+    return ocr_engine.run_ocr(image_path, save_output)
+
+def run_mistral_ocr_batch(
+    image_paths: List[str],
+    api_key: str,
+    save_output: bool = True,
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Run Mistral OCR on many images from synchronous code, using a thread pool.
+    
+    The calls are network-bound, so threads overlap the round-trips.
+    
+    Args:
+        image_paths: Paths to input images
+        api_key: Mistral API key
+        save_output: Whether to save OCR output to files
+        max_workers: Max OCR requests in flight at once
+        
+    Returns:
+        List of OCR result dicts in the same order as `image_paths`
+    """
+    ocr_engine = get_mistral_ocr(api_key)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: ocr_engine.run_ocr(path, save_output), image_paths))
+
+async def run_mistral_ocr_async(image_path: str, api_key: str, save_output: bool = True) -> Dict[str, Any]:
+    """Run Mistral OCR on an image using the async client."""
+    ocr_engine = get_mistral_ocr(api_key)
+    return await ocr_engine.run_ocr_async(image_path, save_output)
+
+async def run_mistral_ocr_many(
+    image_paths: List[str],
+    api_key: str,
+    save_output: bool = True,
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Run Mistral OCR on many images concurrently.
+    
+    Args:
+        image_paths: Paths to input images
+        api_key: Mistral API key
+        save_output: Whether to save OCR output to files
+        concurrency: Max OCR requests in flight at once
+        
+    Returns:
+        List of OCR result dicts in the same order as `image_paths`
+    """
+    ocr_engine = get_mistral_ocr(api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_one(image_path: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await ocr_engine.run_ocr_async(image_path, save_output)
+
+    try:
+        return await asyncio.gather(*(_run_one(path) for path in image_paths))
+    finally:
+        # The client is bound to this loop; close it here rather than leak its pool
+        await ocr_engine._async_client.aclose()
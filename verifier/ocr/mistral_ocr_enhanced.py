@@ -2,23 +2,65 @@
 Enhanced Mistral AI OCR with specialized document prompts.
 """
 
-import base64
+import asyncio
+import json
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path  # ADD THIS IMPORT
+import httpx
 from mistralai import Mistral
 from verifier.utils.logger import get_logger
-from verifier.io.storage import save_ocr_output, save_raw_ocr_text
+from verifier.utils.async_http import LoopBoundClient
+from verifier.io.storage import (
+    save_ocr_output, save_raw_ocr_text,
+    document_fingerprint, ocr_cache_key, lookup_cached_ocr, store_cached_ocr
+)
+from verifier.ocr.mistral_ocr import image_to_data_url, split_ocr_lines
 
 logger = get_logger(__name__)
 
+# Document-specific prompts for better OCR
+DOC_PROMPTS = {
+    "government_id": "Extract all text from this government ID document. Preserve exact formatting, including numbers, dates, and addresses. Return the text exactly as it appears.",
+    "bank_statement": "Extract all text from this bank statement. Preserve exact account numbers, amounts, dates, and personal information. Return the text exactly as it appears.",
+    "employment_letter": "Extract all text from this employment letter. Preserve exact names, dates, addresses, and employment details. Return the text exactly as it appears.",
+    "document": "Extract all text from this document image. Return the text exactly as it appears, preserving line breaks, numbers, and special characters."
+}
+
+# Bump when DOC_PROMPTS or the request parameters change, to invalidate cached OCR results
+PROMPT_VERSION = "1"
+
+OCR_MODEL = "mistral-large-latest"
+OCR_MAX_TOKENS = 4000
+_BATCH_TERMINAL_STATUSES = ('SUCCESS', 'FAILED', 'TIMEOUT_EXCEEDED', 'CANCELLED')
+# Signed URLs must outlive a batch job; uploaded images are deleted (and their
+# URLs invalidated) as soon as the OCR call or batch job finishes
+SIGNED_URL_EXPIRY_HOURS = 24
+
 class EnhancedMistralOCR:
-    def __init__(self, api_key: str):
-        """Initialize enhanced Mistral AI client."""
-        self.client = Mistral(api_key=api_key)
+    def __init__(self, api_key: str, use_cache: bool = True, upload_images: bool = False):
+        """
+        Initialize enhanced Mistral AI client.
+
+        Args:
+            api_key: Mistral API key
+            use_cache: Reuse OCR results for identical images
+            upload_images: Upload each image and reference it by signed URL instead
+                of sending it inline as base64. Uploads are deleted after the OCR call.
+        """
+        self._http = httpx.Client(follow_redirects=True)
+        self.client = Mistral(api_key=api_key, client=self._http)
+        # Async SDK client, rebuilt for each event loop (e.g. every asyncio.run)
+        self._async_client = LoopBoundClient(
+            lambda http: Mistral(api_key=api_key, client=self._http, async_client=http),
+            follow_redirects=True
+        )
+        self.use_cache = use_cache
+        self.upload_images = upload_images
         logger.info("Enhanced Mistral AI OCR initialized")
     
-    def run_ocr(self, image_path: str, doc_type: str = "document", save_output: bool = True) -> Dict[str, Any]:
+    def run_ocr(self, image_path: str, doc_type: str = "document", save_output: bool = True,
+                fingerprint: Optional[str] = None) -> Dict[str, Any]:
         """
         Run enhanced Mistral AI OCR with document-specific prompts.
         
@@ -26,123 +68,379 @@ class EnhancedMistralOCR:
             image_path: Path to input image
             doc_type: Type of document for better prompting
             save_output: Whether to save OCR output to file
+            fingerprint: Precomputed `document_fingerprint` of the image for the cache key
             
         Returns:
             Dict with raw_text, lines, and timing info
         """
         start_time = time.time()
+        uploads = []
         
         try:
-            # Read and encode image
-            with open(image_path, "rb") as image_file:
-                image_data = image_file.read()
-            
-            base64_image = base64.b64encode(image_data).decode('utf-8')
-            
-            # Document-specific prompts for better OCR
-            doc_prompts = {
-                "government_id": "Extract all text from this government ID document. Preserve exact formatting, including numbers, dates, and addresses. Return the text exactly as it appears.",
-                "bank_statement": "Extract all text from this bank statement. Preserve exact account numbers, amounts, dates, and personal information. Return the text exactly as it appears.",
-                "employment_letter": "Extract all text from this employment letter. Preserve exact names, dates, addresses, and employment details. Return the text exactly as it appears.",
-                "document": "Extract all text from this document image. Return the text exactly as it appears, preserving line breaks, numbers, and special characters."
-            }
-            
-            prompt = doc_prompts.get(doc_type, doc_prompts["document"])
-            
-            messages = [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": f"data:image/jpeg;base64,{base64_image}"
-                        }
-                    ]
-                }
-            ]
-            
+            cache_key, cached = self._lookup_cache(image_path, doc_type, start_time, save_output, fingerprint)
+            if cached is not None:
+                return cached
+
             # Call Mistral API
             response = self.client.chat.complete(
-                model="mistral-large-latest",
-                messages=messages,
-                max_tokens=4000
+                model=OCR_MODEL,
+                messages=self._build_messages(image_path, doc_type, uploads),
+                max_tokens=OCR_MAX_TOKENS
+            )
+            full_text = response.choices[0].message.content if response and response.choices else None
+            return self._store_cache(cache_key, self._build_result(full_text, image_path, doc_type, start_time, save_output))
+        except Exception as e:
+            return self._error_result(e, start_time)
+        finally:
+            self._delete_uploads(uploads)
+
+    async def run_ocr_async(self, image_path: str, doc_type: str = "document", save_output: bool = True,
+                            fingerprint: Optional[str] = None) -> Dict[str, Any]:
+        """Async variant of `run_ocr`; the API call does not block the event loop."""
+        start_time = time.time()
+        uploads = []
+
+        try:
+            cache_key, cached = self._lookup_cache(image_path, doc_type, start_time, save_output, fingerprint)
+            if cached is not None:
+                return cached
+
+            response = await self._async_client.get().chat.complete_async(
+                model=OCR_MODEL,
+                messages=self._build_messages(image_path, doc_type, uploads),
+                max_tokens=OCR_MAX_TOKENS
+            )
+            full_text = response.choices[0].message.content if response and response.choices else None
+            return self._store_cache(cache_key, self._build_result(full_text, image_path, doc_type, start_time, save_output))
+        except Exception as e:
+            return self._error_result(e, start_time)
+        finally:
+            self._delete_uploads(uploads)
+
+    def run_ocr_batch(
+        self,
+        items: List[Tuple[str, str]],
+        save_output: bool = True,
+        poll_timeout_s: float = 3600.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Run enhanced OCR on several images with a single Mistral Batch API job.
+
+        Args:
+            items: List of (image_path, doc_type) pairs
+            save_output: Whether to save OCR output to file
+            poll_timeout_s: Give up waiting for the batch job after this many seconds
+
+        Returns:
+            OCR results in the same order as `items`. Images without a usable
+            batch result are re-run individually.
+        """
+        if len(items) < 2:
+            return [self.run_ocr(image_path, doc_type, save_output) for image_path, doc_type in items]
+
+        start_time = time.time()
+        cached = [self._lookup_cache(image_path, doc_type, start_time, save_output) for image_path, doc_type in items]
+        pending = [i for i, (_, hit) in enumerate(cached) if hit is None]
+        uploads = []
+        try:
+            responses = self._run_batch(
+                {str(i): self._build_messages(*items[i], uploads) for i in pending},
+                poll_timeout_s
+            ) if len(pending) > 1 else {}
+        except Exception as e:
+            logger.error(f"Enhanced Mistral batch OCR failed: {e}, falling back to per-image calls")
+            responses = {}
+        finally:
+            self._delete_uploads(uploads)
+
+        results = []
+        for i, (image_path, doc_type) in enumerate(items):
+            cache_key, hit = cached[i]
+            full_text = responses.get(str(i))
+            if hit is not None:
+                results.append(hit)
+            elif full_text:
+                results.append(self._store_cache(
+                    cache_key, self._build_result(full_text, image_path, doc_type, start_time, save_output)
+                ))
+            else:
+                results.append(self.run_ocr(image_path, doc_type, save_output))
+
+        processing_time = (time.time() - start_time) * 1000
+        logger.info(f"Enhanced Mistral batch OCR completed in {processing_time:.2f}ms for {len(items)} images")
+        return results
+
+    def _run_batch(self, conversations: Dict[str, list], poll_timeout_s: float) -> Dict[str, str]:
+        """Submit conversations (keyed by custom_id) as one batch job and return response texts by custom_id."""
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "body": {"messages": messages, "max_tokens": OCR_MAX_TOKENS}
+            }, ensure_ascii=False)
+            for custom_id, messages in conversations.items()
+        ]
+        batch_file = self.client.files.upload(
+            file={"file_name": "ocr_batch.jsonl", "content": "\n".join(lines).encode('utf-8')},
+            purpose="batch"
+        )
+        job = self.client.batch.jobs.create(
+            input_files=[batch_file.id],
+            model=OCR_MODEL,
+            endpoint="/v1/chat/completions"
+        )
+        logger.info(f"Submitted Mistral batch {job.id} with {len(conversations)} images")
+
+        deadline = time.time() + poll_timeout_s
+        attempt = 0
+        while job.status not in _BATCH_TERMINAL_STATUSES:
+            if time.time() > deadline:
+                try:
+                    self.client.batch.jobs.cancel(job_id=job.id)
+                except Exception:
+                    pass
+                raise TimeoutError(f"Mistral batch {job.id} still {job.status} after {poll_timeout_s}s")
+            time.sleep(min(1.0 * (attempt + 1), 60.0))
+            attempt += 1
+            job = self.client.batch.jobs.get(job_id=job.id)
+
+        if job.status != 'SUCCESS' or not job.output_file:
+            raise RuntimeError(f"Mistral batch {job.id} ended with status {job.status}")
+
+        responses = {}
+        output = self.client.files.download(file_id=job.output_file).read()
+        for line in output.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            body = (record.get('response') or {}).get('body') or {}
+            choices = body.get('choices') or []
+            if choices:
+                responses[record.get('custom_id')] = choices[0].get('message', {}).get('content') or ""
+        return responses
+
+    def _lookup_cache(self, image_path: str, doc_type: str, start_time: float, save_output: bool,
+                      fingerprint: Optional[str] = None) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Return (cache_key, cached result or None); the key is None when caching is off.
+
+        A hit is finished like a fresh result: its timing and timestamp are
+        refreshed and it is saved to ocr_outputs/ when `save_output` is set.
+        """
+        if not self.use_cache:
+            return None, None
+        try:
+            cache_key = ocr_cache_key(fingerprint or document_fingerprint(image_path), doc_type, PROMPT_VERSION)
+        except OSError:  # unreadable image: let the OCR call report the error
+            return None, None
+        cached = lookup_cached_ocr(cache_key)
+        if cached is None:
+            return cache_key, None
+        processing_time = (time.time() - start_time) * 1000
+        cached.update({
+            "time_ms": processing_time,
+            "image_path": image_path,
+            "timestamp": time.time(),
+            "cache_hit": True
+        })
+        if save_output:
+            try:
+                self._save_output(cached, image_path, doc_type)
+            except Exception as e:  # the cached text is still good
+                logger.warning(f"Failed to save cached OCR output for {image_path}: {e}")
+        logger.info(f"Enhanced Mistral OCR cache hit in {processing_time:.2f}ms for {doc_type}")
+        return cache_key, cached
+
+    def _store_cache(self, cache_key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successful OCR result under `cache_key` and return it unchanged."""
+        if cache_key and result.get("success"):
+            store_cached_ocr(cache_key, result)
+        return result
+
+    def _image_url(self, image_path: str, uploads: List[str]) -> str:
+        """Signed URL of the uploaded image when uploads are on, else an inline data URL."""
+        if self.upload_images:
+            try:
+                return self._signed_image_url(image_path, uploads)
+            except Exception as e:
+                logger.warning(f"Image upload failed for {image_path}: {e}, sending it inline")
+        # Read and encode image
+        return image_to_data_url(image_path)
+
+    def _signed_image_url(self, image_path: str, uploads: List[str]) -> str:
+        """Upload an image, record its file id in `uploads` and return a signed URL for it."""
+        with open(image_path, "rb") as image_file:
+            uploaded = self.client.files.upload(
+                file={"file_name": Path(image_path).name, "content": image_file.read()},
+                purpose="ocr"
             )
+        uploads.append(uploaded.id)
+        logger.debug(f"Uploaded {image_path} as Mistral file {uploaded.id}")
+        signed = self.client.files.get_signed_url(file_id=uploaded.id, expiry=SIGNED_URL_EXPIRY_HOURS)
+        return signed.url
+
+    def _delete_uploads(self, uploads: List[str]):
+        """Delete uploaded images from Mistral file storage; they hold identity-document PII."""
+        for file_id in uploads:
+            try:
+                self.client.files.delete(file_id=file_id)
+            except Exception as e:
+                logger.warning(f"Failed to delete uploaded Mistral file {file_id}: {e}")
+        uploads.clear()
+
+    def _build_messages(self, image_path: str, doc_type: str, uploads: List[str]) -> list:
+        """
+        Prepare OCR messages with the document-specific prompt and encoded image.
+
+        Files uploaded for the image are appended to `uploads`; the caller
+        deletes them with `_delete_uploads` once the request is done.
+        """
+        image_url = self._image_url(image_path, uploads)
+        prompt = DOC_PROMPTS.get(doc_type, DOC_PROMPTS["document"])
+
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prompt
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": image_url
+                    }
+                ]
+            }
+        ]
+
+    def _build_result(self, full_text: Optional[str], image_path: str, doc_type: str,
+                      start_time: float, save_output: bool) -> Dict[str, Any]:
+        """Turn OCR text into the result dict, saving it if requested."""
+        processing_time = (time.time() - start_time) * 1000
+        
+        if full_text:
+            # Process into structured lines
+            lines = split_ocr_lines(full_text)
+            word_count = len(full_text.split())
             
-            processing_time = (time.time() - start_time) * 1000
+            result = {
+                "raw_text": full_text,
+                "lines": lines,
+                "time_ms": processing_time,
+                "word_count": word_count,
+                "success": True,
+                "engine": "mistral_api_enhanced",
+                "doc_type": doc_type,
+                "image_path": image_path,
+                "timestamp": time.time()
+            }
             
-            if response and response.choices:
-                full_text = response.choices[0].message.content
-                
-                # Process into structured lines
-                lines = []
-                for i, line_text in enumerate(full_text.split('\n')):
-                    clean_text = line_text.strip()
-                    if clean_text:
-                        lines.append({
-                            'text': clean_text,
-                            'confidence': 95.0,
-                            'bbox': [0, i * 20, 100, 20],
-                            'line_number': i
-                        })
-                
-                result = {
-                    "raw_text": full_text,
-                    "lines": lines,
-                    "time_ms": processing_time,
-                    "word_count": len(full_text.split()),
-                    "success": True,
-                    "engine": "mistral_api_enhanced",
-                    "doc_type": doc_type,
-                    "image_path": image_path,
-                    "timestamp": time.time()
-                }
-                
-                # Save OCR output to file
-                if save_output:
-                    filename = f"{Path(image_path).stem}_{doc_type}"
-                    save_ocr_output("mistral_enhanced", filename, result)
-                    save_raw_ocr_text("mistral_enhanced", filename, full_text, {
-                        "image_path": image_path,
-                        "doc_type": doc_type,
-                        "processing_time_ms": processing_time,
-                        "lines_extracted": len(lines),
-                        "word_count": len(full_text.split())
-                    })
-                
-                logger.info(f"Enhanced Mistral OCR completed in {processing_time:.2f}ms for {doc_type}, extracted {len(lines)} lines")
-                return result
-            else:
-                logger.warning(f"No text detected by Enhanced Mistral OCR for {doc_type}")
-                result = {
-                    "raw_text": "",
-                    "lines": [],
-                    "time_ms": processing_time,
-                    "success": False,
-                    "error": "No text detected",
-                    "engine": "mistral_api_enhanced"
-                }
-                return result
-                
-        except Exception as e:
-            logger.error(f"Enhanced Mistral OCR failed: {e}")
-            processing_time = (time.time() - start_time) * 1000
+            # Save OCR output to file
+            if save_output:
+                self._save_output(result, image_path, doc_type)
+            
+            logger.info(f"Enhanced Mistral OCR completed in {processing_time:.2f}ms for {doc_type}, extracted {len(lines)} lines")
+            return result
+        else:
+            logger.warning(f"No text detected by Enhanced Mistral OCR for {doc_type}")
             result = {
                 "raw_text": "",
                 "lines": [],
                 "time_ms": processing_time,
                 "success": False,
-                "error": str(e),
+                "error": "No text detected",
                 "engine": "mistral_api_enhanced"
             }
             return result
 
+    def _save_output(self, result: Dict[str, Any], image_path: str, doc_type: str):
+        """Write a successful result and its raw text under ocr_outputs/mistral_enhanced."""
+        filename = f"{Path(image_path).stem}_{doc_type}"
+        save_ocr_output("mistral_enhanced", filename, result)
+        save_raw_ocr_text("mistral_enhanced", filename, result["raw_text"], {
+            "image_path": image_path,
+            "doc_type": doc_type,
+            "processing_time_ms": result["time_ms"],
+            "lines_extracted": len(result.get("lines", [])),
+            "word_count": result.get("word_count", len(result["raw_text"].split()))
+        })
+
+    def _error_result(self, error: Exception, start_time: float) -> Dict[str, Any]:
+        """Failure result for an OCR call that raised."""
+        logger.error(f"Enhanced Mistral OCR failed: {error}")
+        processing_time = (time.time() - start_time) * 1000
+        result = {
+            "raw_text": "",
+            "lines": [],
+            "time_ms": processing_time,
+            "success": False,
+            "error": str(error),
+            "engine": "mistral_api_enhanced"
+        }
+        return result
+
+# Global instance
+_enhanced_mistral_ocr = None
+
+def get_enhanced_mistral_ocr(api_key: str, upload_images: Optional[bool] = None) -> EnhancedMistralOCR:
+    """
+    Get or create Enhanced Mistral OCR instance (reuses the client's HTTP connections).
+
+    `upload_images` updates the instance's setting when given; None keeps it (default off).
+    """
+    global _enhanced_mistral_ocr
+    if _enhanced_mistral_ocr is None:
+        _enhanced_mistral_ocr = EnhancedMistralOCR(api_key)
+    if upload_images is not None:
+        _enhanced_mistral_ocr.upload_images = upload_images
+    return _enhanced_mistral_ocr
+
 def run_enhanced_mistral_ocr(image_path: str, api_key: str, doc_type: str = "document", save_output: bool = True) -> Dict[str, Any]:
     """
     Run enhanced Mistral OCR with document-specific prompting.
     """
-    ocr_engine = EnhancedMistralOCR(api_key)
-    return ocr_engine.run_ocr(image_path, doc_type, save_output)
\ No newline at end of file
+    ocr_engine = get_enhanced_mistral_ocr(api_key)
+    return ocr_engine.run_ocr(image_path, doc_type, save_output)
+
+def run_enhanced_mistral_ocr_batch(items: List[Tuple[str, str]], api_key: str, save_output: bool = True) -> List[Dict[str, Any]]:
+    """
+    Run enhanced Mistral OCR on several (image_path, doc_type) pairs via one batch job.
+    """
+    ocr_engine = get_enhanced_mistral_ocr(api_key)
+    return ocr_engine.run_ocr_batch(items, save_output)
+
+async def run_enhanced_mistral_ocr_async(image_path: str, api_key: str, doc_type: str = "document", save_output: bool = True) -> Dict[str, Any]:
+    """Run enhanced Mistral OCR on an image using the async client."""
+    ocr_engine = get_enhanced_mistral_ocr(api_key)
+    return await ocr_engine.run_ocr_async(image_path, doc_type, save_output)
+
+async def run_enhanced_mistral_ocr_many(
+    items: List[Tuple[str, str]],
+    api_key: str,
+    save_output: bool = True,
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Run enhanced Mistral OCR on many (image_path, doc_type) pairs concurrently.
+    
+    Args:
+        items: List of (image_path, doc_type) pairs
+        api_key: Mistral API key
+        save_output: Whether to save OCR output to files
+        concurrency: Max OCR requests in flight at once
+        
+    Returns:
+        List of OCR result dicts in the same order as `items`
+    """
+    ocr_engine = get_enhanced_mistral_ocr(api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_one(image_path: str, doc_type: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await ocr_engine.run_ocr_async(image_path, doc_type, save_output)
+
+    try:
+        return await asyncio.gather(*(_run_one(path, doc_type) for path, doc_type in items))
+    finally:
+        # The client is bound to this loop; close it here rather than leak its pool
+        await ocr_engine._async_client.aclose()
\ No newline at end of file
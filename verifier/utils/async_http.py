@@ -0,0 +1,66 @@
+"""
+Async HTTP clients bound to the running event loop.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+import httpx
+from verifier.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class LoopBoundClient:
+    """
+    Holds an async API client per event loop.
+
+    An httpx.AsyncClient keeps its connections on the loop it first ran on, so
+    an SDK client built around one cannot be shared across loops (e.g. separate
+    `asyncio.run` calls, or loops on different threads driving the same
+    singleton). `get()` returns the running loop's client, creating it on first
+    use; `aclose()` closes it from its own loop. Clients of loops that have
+    since closed are dropped on the next `get()`.
+    """
+
+    def __init__(self, factory: Callable[[httpx.AsyncClient], Any], limits: Optional[httpx.Limits] = None,
+                 follow_redirects: bool = False):
+        """
+        Args:
+            factory: Builds the SDK client around the given httpx.AsyncClient
+            limits: Connection limits for each httpx.AsyncClient
+            follow_redirects: Passed through to httpx.AsyncClient
+        """
+        self._factory = factory
+        self._limits = limits
+        self._follow_redirects = follow_redirects
+        self._lock = threading.Lock()
+        # loop -> (httpx client, SDK client)
+        self._clients: Dict[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, Any]] = {}
+
+    def get(self) -> Any:
+        """Return the client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(loop)
+            if entry is None:
+                self._drop_closed_loops()
+                kwargs = {"follow_redirects": self._follow_redirects}
+                if self._limits is not None:
+                    kwargs["limits"] = self._limits
+                http = httpx.AsyncClient(**kwargs)
+                entry = self._clients[loop] = (http, self._factory(http))
+        return entry[1]
+
+    async def aclose(self):
+        """Close the running event loop's client, if it has one."""
+        with self._lock:
+            entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].aclose()
+
+    def _drop_closed_loops(self):
+        """Forget clients of closed loops (caller holds the lock)."""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            # Its connections died with the loop and cannot be closed from another one
+            logger.debug("Dropping async HTTP client of a closed event loop")
+            del self._clients[loop]
@@ -5,11 +5,41 @@ Logging configuration for document verification pipeline.
 import logging
 import os
 import sys
+import time
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-def setup_logging(log_dir: str = "logs", log_level: int = logging.INFO):
-    """Setup logging configuration."""
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime once per second instead of once per record."""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._time_cache = (None, "")  # (epoch second, formatted date/time)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
+# Set once setup_logging has configured the root logger in this process
+_INITIALIZED = False
+
+def setup_logging(log_dir: str = "logs", log_level: int = logging.INFO, force: bool = False):
+    """
+    Setup logging configuration.
+
+    Only the first call configures handlers; pass force=True to replace them.
+    """
+    global _INITIALIZED
+    if _INITIALIZED and not force:
+        return
+    _INITIALIZED = True
+
     Path(log_dir).mkdir(parents=True, exist_ok=True)
     
     # Root logger
@@ -21,7 +51,7 @@ def setup_logging(log_dir: str = "logs", log_level: int = logging.INFO):
         logger.removeHandler(handler)
     
     # Formatter
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
@@ -48,9 +78,24 @@ def setup_logging(log_dir: str = "logs", log_level: int = logging.INFO):
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
 
+def _reopen_file_handlers():
+    """Give a forked child its own log file descriptors instead of the parent's."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, RotatingFileHandler):
+            handler.acquire()
+            try:
+                if handler.stream:
+                    handler.stream.close()
+                handler.stream = handler._open()
+            finally:
+                handler.release()
+
 def get_logger(name: str) -> logging.Logger:
     """Get logger for module."""
     return logging.getLogger(name)
 
 # Initialize logging on import
-setup_logging()
\ No newline at end of file
+setup_logging()
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reopen_file_handlers)
\ No newline at end of file
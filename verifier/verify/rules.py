@@ -2,11 +2,35 @@
 Cross-document verification rules implementation.
 """
 
+import re
+import string
 from typing import Dict, Any, List, Set, Tuple
 from verifier.utils.logger import get_logger
+from verifier.normalize.cleaners import name_match_key
 
 logger = get_logger(__name__)
 
+# PAN: 5 letters, 4 digits, 1 letter (checked upper-cased); Aadhaar: 12 digits
+_PAN_RE = re.compile(r'[A-Z]{5}[0-9]{4}[A-Z]')
+_AADHAAR_RE = re.compile(r'[0-9]{12}')
+
+# Deletes ASCII non-digits (spaces, hyphens, brackets, '+', ...) from phone numbers in one pass
+_PHONE_STRIP = str.maketrans('', '', ''.join(sorted(set(string.printable) - set(string.digits))))
+
+# Fields the rules compare, in rule order
+RULE_FIELDS = ('full_name', 'date_of_birth', 'address', 'phone_number',
+               'father_name', 'pan_number', 'aadhaar_number')
+
+# Result keys, in rule order
+RULE_NAMES = ('rule_1_name_match', 'rule_2_dob_match', 'rule_3_address_match', 'rule_4_phone_match',
+              'rule_5_father_name_match', 'rule_6_pan_format', 'rule_7_aadhaar_format')
+
+# Fewer extracted fields than this (across all documents) fails verification outright
+MIN_EXTRACTED_FIELDS = 5
+
+# Name fields -> entry holding their match keys ({doc_type: name_match_key}) in _collect_fields
+_NAME_KEY_FIELDS = {'full_name': 'full_name_key', 'father_name': 'father_name_key'}
+
 def verify_person(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Run all verification rules on extracted data.
@@ -17,28 +41,35 @@ def verify_person(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict with verification results for all rules
     """
+    fields, total_extracted_fields = _collect_fields(extracted_data)
+    
+    # If we have very little data, fail without running the rules
+    if total_extracted_fields < MIN_EXTRACTED_FIELDS:
+        logger.warning(f"Insufficient data for verification: only {total_extracted_fields} fields extracted")
+        return {rule: {"status": "SKIPPED", "reason": "insufficient data"} for rule in RULE_NAMES}
+    
     results = {}
     
     # Rule 1: Name matching
-    results['rule_1_name_match'] = verify_name_match(extracted_data)
+    results['rule_1_name_match'] = _check_name_match(fields['full_name'], fields['full_name_key'])
     
     # Rule 2: DOB matching
-    results['rule_2_dob_match'] = verify_dob_match(extracted_data)
+    results['rule_2_dob_match'] = _check_dob_match(fields['date_of_birth'])
     
     # Rule 3: Address matching
-    results['rule_3_address_match'] = verify_address_match(extracted_data)
+    results['rule_3_address_match'] = _check_address_match(fields['address'])
     
     # Rule 4: Phone matching
-    results['rule_4_phone_match'] = verify_phone_match(extracted_data)
+    results['rule_4_phone_match'] = _check_phone_match(fields['phone_number'])
     
     # Rule 5: Father's name matching
-    results['rule_5_father_name_match'] = verify_father_name_match(extracted_data)
+    results['rule_5_father_name_match'] = _check_father_name_match(fields['father_name'], fields['father_name_key'])
     
     # Rule 6: PAN format validation
-    results['rule_6_pan_format'] = verify_pan_format(extracted_data)
+    results['rule_6_pan_format'] = _check_pan_format(fields['pan_number'])
     
     # Rule 7: Aadhaar format validation
-    results['rule_7_aadhaar_format'] = verify_aadhaar_format(extracted_data)
+    results['rule_7_aadhaar_format'] = _check_aadhaar_format(fields['aadhaar_number'])
     
     # Calculate overall status - MORE LENIENT VERSION
     # Require only key rules to pass for overall verification
@@ -47,17 +78,7 @@ def verify_person(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     passed_key_rules = sum(1 for rule in key_rules 
                           if results.get(rule, {}).get('status') == 'PASS')
     
-    total_extracted_fields = sum(
-        1 for doc_data in extracted_data.values() 
-        for field_data in doc_data.values() 
-        if field_data.get('value') is not None
-    )
-    
-    # If we have very little data, be more conservative
-    if total_extracted_fields < 5:
-        overall_status = "FAILED"
-        logger.warning(f"Insufficient data for verification: only {total_extracted_fields} fields extracted")
-    elif passed_key_rules >= len(key_rules):
+    if passed_key_rules >= len(key_rules):
         overall_status = "VERIFIED"
     else:
         overall_status = "FAILED"
@@ -66,14 +87,39 @@ def verify_person(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     
     return results
 
+def _collect_fields(extracted_data: Dict[str, Any],
+                    names: Tuple[str, ...] = RULE_FIELDS) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Gather rule inputs from all documents in one pass.
+    
+    Returns:
+        ({field name: {doc_type: value}} for non-empty values of `names`,
+         number of fields across all documents whose value is not None)
+    """
+    fields = {name: {} for name in names}
+    fields.update((_NAME_KEY_FIELDS[name], {}) for name in names if name in _NAME_KEY_FIELDS)
+    total_extracted_fields = 0
+    for doc_type, data in extracted_data.items():
+        for name, field_data in data.items():
+            if not isinstance(field_data, dict):
+                continue
+            value = field_data.get('value')
+            if value is None:
+                continue
+            total_extracted_fields += 1
+            if value and name in fields:
+                fields[name][doc_type] = value
+                if name in _NAME_KEY_FIELDS:
+                    fields[_NAME_KEY_FIELDS[name]][doc_type] = field_data.get('normalized_value') or name_match_key(value)
+    return fields, total_extracted_fields
+
 def verify_name_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """Rule 1: Verify name consistency across documents."""
-    names = {}
-    for doc_type, data in extracted_data.items():
-        name_field = data.get('full_name', {})
-        if name_field.get('value'):
-            names[doc_type] = name_field['value']
-    
+    fields = _collect_fields(extracted_data, ('full_name',))[0]
+    return _check_name_match(fields['full_name'], fields['full_name_key'])
+
+def _check_name_match(names: Dict[str, Any], name_keys: Dict[str, str]) -> Dict[str, Any]:
+    """Rule 1 check on {doc_type: full_name} values and their name_match_key."""
     if len(names) < 2:
         return {
             "status": "FAIL",
@@ -81,15 +127,8 @@ def verify_name_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
             "values": names
         }
     
-    # Normalize and compare names
-    normalized_names = {}
-    for doc_type, name in names.items():
-        # Convert to lowercase, split into tokens, sort, and join
-        tokens = set(name.lower().split())
-        normalized_names[doc_type] = ' '.join(sorted(tokens))
-    
     # Check if all normalized names are equal
-    unique_names = set(normalized_names.values())
+    unique_names = set(name_keys.values())
     
     if len(unique_names) == 1:
         return {
@@ -106,12 +145,10 @@ def verify_name_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def verify_dob_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """Rule 2: Verify date of birth consistency."""
-    dobs = {}
-    for doc_type, data in extracted_data.items():
-        dob_field = data.get('date_of_birth', {})
-        if dob_field.get('value'):
-            dobs[doc_type] = dob_field['value']
-    
+    return _check_dob_match(_collect_fields(extracted_data, ('date_of_birth',))[0]['date_of_birth'])
+
+def _check_dob_match(dobs: Dict[str, Any]) -> Dict[str, Any]:
+    """Rule 2 check on {doc_type: date_of_birth} values."""
     if len(dobs) < 2:
         return {
             "status": "FAIL",
@@ -137,12 +174,10 @@ def verify_dob_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def verify_address_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """Rule 3: Verify address consistency (city, state, pincode must match)."""
-    addresses = {}
-    for doc_type, data in extracted_data.items():
-        address_field = data.get('address', {})
-        if address_field.get('value'):
-            addresses[doc_type] = address_field['value']
-    
+    return _check_address_match(_collect_fields(extracted_data, ('address',))[0]['address'])
+
+def _check_address_match(addresses: Dict[str, Any]) -> Dict[str, Any]:
+    """Rule 3 check on {doc_type: address} values."""
     if len(addresses) < 2:
         return {
             "status": "FAIL",
@@ -182,16 +217,15 @@ def verify_address_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def verify_phone_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """Rule 4: Verify phone number consistency."""
+    return _check_phone_match(_collect_fields(extracted_data, ('phone_number',))[0]['phone_number'])
+
+def _check_phone_match(raw_phones: Dict[str, Any]) -> Dict[str, Any]:
+    """Rule 4 check on {doc_type: phone_number} values."""
     phones = {}
-    for doc_type, data in extracted_data.items():
-        phone_field = data.get('phone_number', {})
-        if phone_field.get('value'):
-            # Normalize by taking last 10 digits for Indian numbers
-            phone = phone_field['value']
-            if phone.startswith('+91') and len(phone) == 13:
-                phones[doc_type] = phone[-10:]
-            else:
-                phones[doc_type] = phone
+    for doc_type, phone in raw_phones.items():
+        # Normalize to digits only, keeping the last 10 (drops a +91/0 prefix on Indian numbers)
+        digits = phone.translate(_PHONE_STRIP)
+        phones[doc_type] = digits[-10:] if len(digits) >= 10 else digits
     
     if len(phones) < 2:
         return {
@@ -218,12 +252,11 @@ def verify_phone_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def verify_father_name_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """Rule 5: Verify father's name consistency where present."""
-    father_names = {}
-    for doc_type, data in extracted_data.items():
-        father_field = data.get('father_name', {})
-        if father_field.get('value'):
-            father_names[doc_type] = father_field['value']
-    
+    fields = _collect_fields(extracted_data, ('father_name',))[0]
+    return _check_father_name_match(fields['father_name'], fields['father_name_key'])
+
+def _check_father_name_match(father_names: Dict[str, Any], name_keys: Dict[str, str]) -> Dict[str, Any]:
+    """Rule 5 check on {doc_type: father_name} values and their name_match_key."""
     if len(father_names) < 2:
         return {
             "status": "FAIL",
@@ -231,13 +264,8 @@ def verify_father_name_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
             "values": father_names
         }
     
-    # Normalize and compare (similar to name matching)
-    normalized_names = {}
-    for doc_type, name in father_names.items():
-        tokens = set(name.lower().split())
-        normalized_names[doc_type] = ' '.join(sorted(tokens))
-    
-    unique_names = set(normalized_names.values())
+    # Compare normalized names (similar to name matching)
+    unique_names = set(name_keys.values())
     
     if len(unique_names) == 1:
         return {
@@ -254,12 +282,10 @@ def verify_father_name_match(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def verify_pan_format(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """Rule 6: Validate PAN number format."""
-    pans = {}
-    for doc_type, data in extracted_data.items():
-        pan_field = data.get('pan_number', {})
-        if pan_field.get('value'):
-            pans[doc_type] = pan_field['value']
-    
+    return _check_pan_format(_collect_fields(extracted_data, ('pan_number',))[0]['pan_number'])
+
+def _check_pan_format(pans: Dict[str, Any]) -> Dict[str, Any]:
+    """Rule 6 check on {doc_type: pan_number} values."""
     if not pans:
         return {
             "status": "FAIL",
@@ -270,10 +296,7 @@ def verify_pan_format(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     # Validate each PAN format
     invalid_pans = {}
     for doc_type, pan in pans.items():
-        if not (len(pan) == 10 and 
-                pan[:5].isalpha() and 
-                pan[5:9].isdigit() and 
-                pan[9].isalpha()):
+        if _PAN_RE.fullmatch(pan.upper()) is None:
             invalid_pans[doc_type] = pan
     
     if not invalid_pans:
@@ -291,12 +314,10 @@ def verify_pan_format(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def verify_aadhaar_format(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """Rule 7: Validate Aadhaar number format."""
-    aadhaars = {}
-    for doc_type, data in extracted_data.items():
-        aadhaar_field = data.get('aadhaar_number', {})
-        if aadhaar_field.get('value'):
-            aadhaars[doc_type] = aadhaar_field['value']
-    
+    return _check_aadhaar_format(_collect_fields(extracted_data, ('aadhaar_number',))[0]['aadhaar_number'])
+
+def _check_aadhaar_format(aadhaars: Dict[str, Any]) -> Dict[str, Any]:
+    """Rule 7 check on {doc_type: aadhaar_number} values."""
     if not aadhaars:
         return {
             "status": "FAIL",
@@ -307,7 +328,7 @@ def verify_aadhaar_format(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     # Validate each Aadhaar format (12 digits)
     invalid_aadhaars = {}
     for doc_type, aadhaar in aadhaars.items():
-        if not (len(aadhaar) == 12 and aadhaar.isdigit()):
+        if _AADHAAR_RE.fullmatch(aadhaar) is None:
             invalid_aadhaars[doc_type] = aadhaar
     
     if not invalid_aadhaars: